@@ -3,10 +3,18 @@
 
 from __future__ import print_function, absolute_import, division, unicode_literals
 
+import importlib
+import importlib.util
 import os
+import random
+import re
 import sys
+import tempfile
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
 
 # ============================================================================
 # IMPORT PLUGIN UTILITIES
@@ -23,7 +31,8 @@ try:
         ensure_str,
         ensure_unicode,
         PLUGIN_NAME,
-        PLUGIN_VERSION
+        PLUGIN_VERSION,
+        DEBUG
     )
     debug_print("AudioPlayer: Imported plugin utilities v%s" % PLUGIN_VERSION)
 except ImportError:
@@ -39,16 +48,20 @@ except ImportError:
         if s is None:
             return ""
         if isinstance(s, bytes):
-            try:
-                return s.decode(encoding)
-            except:
-                return s.decode('latin-1', 'ignore')
+            return s.decode(encoding, 'replace')
         return str(s)
     
     ensure_unicode = ensure_str
     
     PLUGIN_NAME = "Westy FileMaster PRO"
     PLUGIN_VERSION = "2.1.0"
+    DEBUG = True
+
+# With debugging off, make debug_print a no-op instead of calling into the
+# package helper to re-check the flag every time
+if not DEBUG:
+    def debug_print(*args, **kwargs):
+        pass
 
 # ============================================================================
 # IMPORT MEDIA UTILITIES - FIXED VERSION
@@ -84,15 +97,18 @@ except Exception as e:
         
         @staticmethod
         def is_audio_file(filename):
-            ext = os.path.splitext(filename)[1].lower()
-            return ext in MediaUtils.SUPPORTED_AUDIO_EXTS
+            return os.path.splitext(filename)[1].lower() in MediaUtils.SUPPORTED_AUDIO_EXTS
+        
+        _TRACK_PREFIX_RE = re.compile(r'^\d{1,3}\s*[.-]\s*')
+        _UNDERSCORE_TABLE = str.maketrans({'_': ' '})
         
         @staticmethod
         def sanitize_filename(filename):
-            import re
             name = os.path.splitext(filename)[0]
-            name = name.replace('_', ' ').replace('-', ' - ')
-            name = re.sub(r'^\d{1,3}\s*[.-]\s*', '', name)
+            name = name.translate(MediaUtils._UNDERSCORE_TABLE)
+            if '-' in name:
+                name = name.replace('-', ' - ')
+            name = MediaUtils._TRACK_PREFIX_RE.sub('', name)
             name = name.strip()
             if len(name) > 50:
                 name = name[:47] + "..."
@@ -131,10 +147,12 @@ except Exception as e:
     
     media_utils = MediaUtils()
     
-    # Create minimal config
+    # Create minimal config; callers only read it, so share one read-only view
+    _DEFAULT_CONFIG = MappingProxyType({'volume': 80, 'repeat_mode': 'none', 'shuffle': False, 'visualization': True})
+    
     class SimpleConfig:
         def get_config(self, module):
-            return {'volume': 80, 'repeat_mode': 'none', 'shuffle': False, 'visualization': True}
+            return _DEFAULT_CONFIG
         def set_config(self, module, key, value):
             return True
     
@@ -155,12 +173,37 @@ except ImportError:
     class Screen:
         def __init__(self, session):
             self.session = session
+            self.onLayoutFinish = []
+            self.onClose = []
         
         def close(self):
             pass
-        
-        def onLayoutFinish(self, callback):
-            callback()
+
+# Dialog screens used by the player's menus and messages
+try:
+    from Screens.MessageBox import MessageBox
+    from Screens.ChoiceBox import ChoiceBox
+    from Screens.InputBox import InputBox
+    DIALOGS_AVAILABLE = True
+    debug_print("AudioPlayer: Dialog screens available")
+except ImportError:
+    DIALOGS_AVAILABLE = False
+    debug_print("AudioPlayer: Dialog screens not available")
+    MessageBox = ChoiceBox = InputBox = None
+
+# Keyboard and file browser only serve playlist save/load; imported on
+# their own so an image without one keeps the other dialogs
+try:
+    from Screens.VirtualKeyBoard import VirtualKeyBoard
+except ImportError:
+    debug_print("AudioPlayer: VirtualKeyBoard not available")
+    VirtualKeyBoard = None
+
+try:
+    from Screens.FileBrowser import FileBrowser
+except ImportError:
+    debug_print("AudioPlayer: FileBrowser not available")
+    FileBrowser = None
 
 try:
     from Components.ActionMap import ActionMap, HelpableActionMap
@@ -232,9 +275,10 @@ except ImportError:
         def __init__(self, list=None):
             self.list = list or []
             self.index = 0
+            self._last = len(self.list) - 1
         
         def getCurrent(self):
-            if self.list and 0 <= self.index < len(self.list):
+            if 0 <= self.index <= self._last:
                 return self.list[self.index]
             return None
         
@@ -242,34 +286,34 @@ except ImportError:
             return self.index
         
         def setIndex(self, index):
-            if 0 <= index < len(self.list):
+            if 0 <= index <= self._last:
                 self.index = index
         
         def selectPrevious(self):
-            if self.index > 0:
-                self.index -= 1
+            self.index -= (self.index > 0)
         
         def selectNext(self):
-            if self.index < len(self.list) - 1:
-                self.index += 1
+            self.index += (self.index < self._last)
         
         def pageUp(self):
             self.index = max(0, self.index - 10)
         
         def pageDown(self):
-            self.index = min(len(self.list) - 1, self.index + 10)
+            self.index = min(self.index + 10, self._last)
         
         def setList(self, lst):
             self.list = lst
-            self.index = min(self.index, len(lst) - 1)
+            self._last = len(lst) - 1
+            self.index = min(self.index, self._last)
     
     class MenuList:
         def __init__(self, list=None):
             self.list = list or []
             self.index = 0
+            self._last = len(self.list) - 1
         
         def getCurrent(self):
-            if self.list and 0 <= self.index < len(self.list):
+            if 0 <= self.index <= self._last:
                 return self.list[self.index]
             return None
         
@@ -277,23 +321,22 @@ except ImportError:
             return self.index
         
         def selectPrevious(self):
-            if self.index > 0:
-                self.index -= 1
+            self.index -= (self.index > 0)
         
         def selectNext(self):
-            if self.index < len(self.list) - 1:
-                self.index += 1
+            self.index += (self.index < self._last)
         
         def setList(self, lst):
             self.list = lst
-            self.index = min(self.index, len(lst) - 1)
+            self._last = len(lst) - 1
+            self.index = min(self.index, self._last)
         
         def moveToIndex(self, index):
-            if 0 <= index < len(self.list):
+            if 0 <= index <= self._last:
                 self.index = index
 
 try:
-    from enigma import eServiceReference, eServiceCenter, iPlayableService, eTimer, getDesktop
+    from enigma import eServiceReference, eServiceCenter, iPlayableService, eTimer, getDesktop, ePoint
     from ServiceReference import ServiceReference
     ENIGMA_CORE_AVAILABLE = True
     debug_print("AudioPlayer: Enigma core available")
@@ -353,106 +396,111 @@ except ImportError as e:
                 return Size()
         return Desktop()
     
+    class ePoint:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+    
     class ServiceReference:
         pass
 
+try:
+    from Tools.LoadPixmap import LoadPixmap
+except ImportError:
+    LoadPixmap = None
+
 # ============================================================================
-# IMPORT MUTAGEN FOR METADATA (OPTIONAL)
+# MUTAGEN FOR METADATA (OPTIONAL, IMPORTED ON FIRST USE)
 # ============================================================================
+# Only probe for mutagen here; its modules are imported the first time a
+# track is actually tagged so plugin start-up does not pay for them.
 try:
-    from mutagen import File as MutagenFile
-    from mutagen.id3 import ID3
-    from mutagen.easyid3 import EasyID3
-    from mutagen.mp3 import MP3
-    from mutagen.flac import FLAC
-    from mutagen.oggvorbis import OggVorbis
-    MUTAGEN_AVAILABLE = True
-    debug_print("AudioPlayer: Mutagen available")
-except ImportError:
+    MUTAGEN_AVAILABLE = importlib.util.find_spec('mutagen') is not None
+except (ImportError, ValueError):
     MUTAGEN_AVAILABLE = False
-    debug_print("AudioPlayer: Mutagen not available")
-    
-    # Create dummy classes
-    class MutagenFile:
-        pass
-    class ID3:
-        pass
-    class EasyID3:
-        pass
-    class MP3:
-        pass
-    class FLAC:
-        pass
-    class OggVorbis:
-        pass
+debug_print("AudioPlayer: Mutagen available: %s" % MUTAGEN_AVAILABLE)
+
+_LAZY_MODULES = {}
+
+def _lazy(name):
+    """Import module on first use and cache it"""
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        module = _LAZY_MODULES[name] = importlib.import_module(name)
+    return module
+
+# Optional sibling screens: (module, class) -> class, or None once an import failed
+_OPTIONAL_SCREENS = {}
+
+def _optional_screen(module, attr):
+    """Return class attr from sibling module, remembering failed imports"""
+    key = (module, attr)
+    if key in _OPTIONAL_SCREENS:
+        return _OPTIONAL_SCREENS[key]
+    try:
+        screen = getattr(importlib.import_module('.' + module, __package__), attr)
+    except (ImportError, AttributeError, TypeError) as e:
+        debug_print("AudioPlayer: %s not available: %s" % (module, str(e)))
+        screen = None
+    _OPTIONAL_SCREENS[key] = screen
+    return screen
 
 # ============================================================================
 # SCREEN SIZE DETECTION
 # ============================================================================
-# Get screen size for skin
+# Query the desktop once; the skin and layout code reuse these constants
 try:
-    FULLHD = getDesktop(0).size().width() >= 1920
+    _desktop_size = getDesktop(0).size()
+    DESKTOP_WIDTH, DESKTOP_HEIGHT = _desktop_size.width(), _desktop_size.height()
+    FULLHD = DESKTOP_WIDTH >= 1920
 except:
-    FULLHD = False
+    DESKTOP_WIDTH, DESKTOP_HEIGHT, FULLHD = 1280, 720, False
 
 # ============================================================================
-# WESTY AUDIO PLAYER CLASS
+# SKIN TEMPLATE AND LAYOUT
 # ============================================================================
-class WestyAudioPlayer(Screen):
-    """Advanced Audio Player with ID3 tag support and visualizations - v2.1.0"""
-    
-    # Dynamic skin based on screen size - FIXED: No f-strings
-    @staticmethod
-    def get_skin():
-        """Generate skin based on desktop size"""
-        try:
-            desktop = getDesktop(0)
-            screen_width, screen_height = desktop.size().width(), desktop.size().height()
-        except:
-            screen_width, screen_height = 1280, 720
-        
-        return """
-        <screen name="WestyAudioPlayer" position="center,center" size="%d,%d" title="%s Audio Player v%s" flags="wfNoBorder">
+_SKIN_TEMPLATE = """
+        <screen name="WestyAudioPlayer" position="center,center" size="{width},{height}" title="{plugin_name} Audio Player v{version}" flags="wfNoBorder">
             <!-- Background -->
-            <widget name="background" position="0,0" size="%d,%d" backgroundColor="#0a0a1a" zPosition="-2"/>
+            <widget name="background" position="0,0" size="{width},{height}" backgroundColor="#0a0a1a" zPosition="-2"/>
             
             <!-- Album Art -->
-            <widget name="album_art" position="%d,%d" size="%d,%d" alphatest="blend" zPosition="-1"/>
-            <widget name="no_art_label" position="%d,%d" size="%d,%d" font="Regular;%d" foregroundColor="#666666" halign="center" valign="center" text="No Album Art" zPosition="0"/>
+            <widget name="album_art" position="{art_x},{art_y}" size="{art_size},{art_size}" alphatest="blend" zPosition="-1"/>
+            <widget name="no_art_label" position="{art_x},{art_y}" size="{art_size},{art_size}" font="Regular;{no_art_font}" foregroundColor="#666666" halign="center" valign="center" text="No Album Art" zPosition="0"/>
             
             <!-- Visualizer -->
-            <widget name="visualizer" position="%d,%d" size="%d,%d" backgroundColor="#000000" zPosition="-1"/>
+            <widget name="visualizer" position="{vis_x},{art_y}" size="{vis_w},{vis_h}" backgroundColor="#000000" zPosition="-1"/>
             
             <!-- Track Info -->
-            <widget name="title_label" position="%d,%d" size="%d,50" font="Regular;%d" foregroundColor="#ffffff" halign="center" noWrap="1" zPosition="1"/>
-            <widget name="artist_label" position="%d,%d" size="%d,30" font="Regular;%d" foregroundColor="#00ff00" halign="center" zPosition="1"/>
-            <widget name="album_label" position="%d,%d" size="%d,30" font="Regular;%d" foregroundColor="#8888ff" halign="center" zPosition="1"/>
+            <widget name="title_label" position="{info_x},{title_y}" size="{info_w},50" font="Regular;{title_font}" foregroundColor="#ffffff" halign="center" noWrap="1" zPosition="1"/>
+            <widget name="artist_label" position="{info_x},{artist_y}" size="{info_w},30" font="Regular;{artist_font}" foregroundColor="#00ff00" halign="center" zPosition="1"/>
+            <widget name="album_label" position="{info_x},{album_y}" size="{info_w},30" font="Regular;{album_font}" foregroundColor="#8888ff" halign="center" zPosition="1"/>
             
             <!-- Time Display -->
-            <widget name="time_current" position="%d,%d" size="200,30" font="Regular;24" foregroundColor="#ffffff" halign="left" zPosition="1"/>
-            <widget name="time_total" position="%d,%d" size="200,30" font="Regular;24" foregroundColor="#ffffff" halign="right" zPosition="1"/>
+            <widget name="time_current" position="{info_x},{time_y}" size="200,30" font="Regular;24" foregroundColor="#ffffff" halign="left" zPosition="1"/>
+            <widget name="time_total" position="{time_total_x},{time_y}" size="200,30" font="Regular;24" foregroundColor="#ffffff" halign="right" zPosition="1"/>
             
             <!-- Progress Bar -->
-            <widget name="progress_bg" position="%d,%d" size="%d,10" backgroundColor="#333333" zPosition="1"/>
-            <widget name="progress" position="%d,%d" size="0,10" backgroundColor="#00ff00" zPosition="2"/>
+            <widget name="progress_bg" position="{progress_x},{time_y}" size="{progress_w},10" backgroundColor="#333333" zPosition="1"/>
+            <widget name="progress" position="{progress_x},{time_y}" size="0,10" backgroundColor="#00ff00" zPosition="2"/>
             
             <!-- Playback Controls -->
-            <widget name="play_pause_btn" position="%d,%d" size="100,100" alphatest="blend" zPosition="3"/>
-            <widget name="prev_btn" position="%d,%d" size="60,60" alphatest="blend" zPosition="3"/>
-            <widget name="next_btn" position="%d,%d" size="60,60" alphatest="blend" zPosition="3"/>
-            <widget name="stop_btn" position="%d,%d" size="60,60" alphatest="blend" zPosition="3"/>
+            <widget name="play_pause_btn" position="{play_x},{play_y}" size="100,100" alphatest="blend" zPosition="3"/>
+            <widget name="prev_btn" position="{prev_x},{ctrl_y}" size="60,60" alphatest="blend" zPosition="3"/>
+            <widget name="next_btn" position="{next_x},{ctrl_y}" size="60,60" alphatest="blend" zPosition="3"/>
+            <widget name="stop_btn" position="{stop_x},{ctrl_y}" size="60,60" alphatest="blend" zPosition="3"/>
             
             <!-- Volume -->
-            <widget name="volume_bg" position="%d,%d" size="200,30" backgroundColor="#333333" zPosition="1"/>
-            <widget name="volume_level" position="%d,%d" size="0,30" backgroundColor="#00ff00" zPosition="2"/>
-            <widget name="volume_icon" position="%d,%d" size="20,30" alphatest="blend" zPosition="3"/>
-            <widget name="volume_text" position="%d,%d" size="80,30" font="Regular;22" foregroundColor="#ffffff" zPosition="3"/>
+            <widget name="volume_bg" position="{info_x},{volume_y}" size="200,30" backgroundColor="#333333" zPosition="1"/>
+            <widget name="volume_level" position="{info_x},{volume_y}" size="0,30" backgroundColor="#00ff00" zPosition="2"/>
+            <widget name="volume_icon" position="{volume_icon_x},{volume_y}" size="20,30" alphatest="blend" zPosition="3"/>
+            <widget name="volume_text" position="{volume_text_x},{volume_y}" size="80,30" font="Regular;22" foregroundColor="#ffffff" zPosition="3"/>
             
             <!-- Playback Mode -->
-            <widget name="play_mode" position="%d,%d" size="80,30" font="Regular;22" foregroundColor="#ffff00" halign="center" zPosition="3"/>
+            <widget name="play_mode" position="{mode_x},{volume_y}" size="80,30" font="Regular;22" foregroundColor="#ffff00" halign="center" zPosition="3"/>
             
             <!-- Equalizer Display -->
-            <widget name="eq_display" position="%d,%d" size="%d,180" backgroundColor="#000022" zPosition="0"/>
+            <widget name="eq_display" position="{vis_x},{eq_y}" size="{vis_w},180" backgroundColor="#000022" zPosition="0"/>
             
             <!-- Key Help -->
             <widget source="key_red" render="Label" position="100,20" size="260,40" font="Regular;26" backgroundColor="red" halign="center" valign="center" zPosition="5"/>
@@ -461,195 +509,330 @@ class WestyAudioPlayer(Screen):
             <widget source="key_blue" render="Label" position="1180,20" size="260,40" font="Regular;26" backgroundColor="blue" halign="center" valign="center" zPosition="5"/>
             
             <!-- Spectrum Analyzer Bars (dynamic) -->
-            <widget name="spectrum_0" position="%d,%d" size="10,180" backgroundColor="#ff0000" zPosition="1"/>
-            <widget name="spectrum_1" position="%d,%d" size="10,180" backgroundColor="#ff5500" zPosition="1"/>
-            <widget name="spectrum_2" position="%d,%d" size="10,180" backgroundColor="#ffff00" zPosition="1"/>
-            <widget name="spectrum_3" position="%d,%d" size="10,180" backgroundColor="#00ff00" zPosition="1"/>
-            <widget name="spectrum_4" position="%d,%d" size="10,180" backgroundColor="#00ffff" zPosition="1"/>
-            <widget name="spectrum_5" position="%d,%d" size="10,180" backgroundColor="#0000ff" zPosition="1"/>
-            <widget name="spectrum_6" position="%d,%d" size="10,180" backgroundColor="#5500ff" zPosition="1"/>
-            <widget name="spectrum_7" position="%d,%d" size="10,180" backgroundColor="#ff00ff" zPosition="1"/>
-            <widget name="spectrum_8" position="%d,%d" size="10,180" backgroundColor="#ffffff" zPosition="1"/>
-            <widget name="spectrum_9" position="%d,%d" size="10,180" backgroundColor="#ff0000" zPosition="1"/>
+            <widget name="spectrum_0" position="{spectrum_0_x},{eq_y}" size="10,180" backgroundColor="#ff0000" zPosition="1"/>
+            <widget name="spectrum_1" position="{spectrum_1_x},{eq_y}" size="10,180" backgroundColor="#ff5500" zPosition="1"/>
+            <widget name="spectrum_2" position="{spectrum_2_x},{eq_y}" size="10,180" backgroundColor="#ffff00" zPosition="1"/>
+            <widget name="spectrum_3" position="{spectrum_3_x},{eq_y}" size="10,180" backgroundColor="#00ff00" zPosition="1"/>
+            <widget name="spectrum_4" position="{spectrum_4_x},{eq_y}" size="10,180" backgroundColor="#00ffff" zPosition="1"/>
+            <widget name="spectrum_5" position="{spectrum_5_x},{eq_y}" size="10,180" backgroundColor="#0000ff" zPosition="1"/>
+            <widget name="spectrum_6" position="{spectrum_6_x},{eq_y}" size="10,180" backgroundColor="#5500ff" zPosition="1"/>
+            <widget name="spectrum_7" position="{spectrum_7_x},{eq_y}" size="10,180" backgroundColor="#ff00ff" zPosition="1"/>
+            <widget name="spectrum_8" position="{spectrum_8_x},{eq_y}" size="10,180" backgroundColor="#ffffff" zPosition="1"/>
+            <widget name="spectrum_9" position="{spectrum_9_x},{eq_y}" size="10,180" backgroundColor="#ff0000" zPosition="1"/>
         </screen>
-        """ % (
-            # Screen size and title
-            screen_width, screen_height,
-            PLUGIN_NAME, PLUGIN_VERSION,
-            
-            # Background
-            screen_width, screen_height,
-            
-            # Album art position and size
-            100 if screen_width >= 1280 else 50,
-            100 if screen_height >= 720 else 50,
-            400 if screen_width >= 1280 else 200,
-            400 if screen_width >= 1280 else 200,
-            100 if screen_width >= 1280 else 50,
-            100 if screen_height >= 720 else 50,
-            400 if screen_width >= 1280 else 200,
-            400 if screen_width >= 1280 else 200,
-            36 if screen_width >= 1280 else 24,
-            
-            # Visualizer
-            520 if screen_width >= 1280 else 270,
-            100 if screen_height >= 720 else 50,
-            660 if screen_width >= 1280 else 480,
-            400 if screen_width >= 1280 else 200,
-            
-            # Track info positions
-            100 if screen_width >= 1280 else 50,
-            520 if screen_height >= 720 else 270,
-            screen_width-200 if screen_width >= 1280 else screen_width-100,
-            40 if screen_width >= 1280 else 28,
-            100 if screen_width >= 1280 else 50,
-            580 if screen_height >= 720 else 310,
-            screen_width-200 if screen_width >= 1280 else screen_width-100,
-            28 if screen_width >= 1280 else 20,
-            100 if screen_width >= 1280 else 50,
-            620 if screen_height >= 720 else 340,
-            screen_width-200 if screen_width >= 1280 else screen_width-100,
-            24 if screen_width >= 1280 else 18,
-            
-            # Time display
-            100 if screen_width >= 1280 else 50,
-            660 if screen_height >= 720 else 380,
-            screen_width-250 if screen_width >= 1280 else screen_width-150,
-            660 if screen_height >= 720 else 380,
-            
-            # Progress bar
-            320 if screen_width >= 1280 else 160,
-            660 if screen_height >= 720 else 380,
-            640 if screen_width >= 1280 else 480,
-            320 if screen_width >= 1280 else 160,
-            660 if screen_height >= 720 else 380,
-            
-            # Playback controls
-            screen_width//2-50,
-            680 if screen_height >= 720 else 300,
-            screen_width//2-140,
-            700 if screen_height >= 720 else 310,
-            screen_width//2+80,
-            700 if screen_height >= 720 else 310,
-            screen_width//2-300,
-            700 if screen_height >= 720 else 310,
-            
-            # Volume display
-            100 if screen_width >= 1280 else 50,
-            700 if screen_height >= 720 else 380,
-            100 if screen_width >= 1280 else 50,
-            700 if screen_height >= 720 else 380,
-            80 if screen_width >= 1280 else 30,
-            700 if screen_height >= 720 else 380,
-            310 if screen_width >= 1280 else 210,
-            700 if screen_height >= 720 else 380,
-            
-            # Play mode
-            screen_width-180 if screen_width >= 1280 else screen_width-80,
-            700 if screen_height >= 720 else 380,
-            
-            # Equalizer display
-            520 if screen_width >= 1280 else 270,
-            510 if screen_height >= 720 else 230,
-            660 if screen_width >= 1280 else 480,
-            
-            # Spectrum analyzer positions
-            530 if screen_width >= 1280 else 280,
-            510 if screen_height >= 720 else 230,
-            550 if screen_width >= 1280 else 300,
-            510 if screen_height >= 720 else 230,
-            570 if screen_width >= 1280 else 320,
-            510 if screen_height >= 720 else 230,
-            590 if screen_width >= 1280 else 340,
-            510 if screen_height >= 720 else 230,
-            610 if screen_width >= 1280 else 360,
-            510 if screen_height >= 720 else 230,
-            630 if screen_width >= 1280 else 380,
-            510 if screen_height >= 720 else 230,
-            650 if screen_width >= 1280 else 400,
-            510 if screen_height >= 720 else 230,
-            670 if screen_width >= 1280 else 420,
-            510 if screen_height >= 720 else 230,
-            690 if screen_width >= 1280 else 440,
-            510 if screen_height >= 720 else 230,
-            710 if screen_width >= 1280 else 460,
-            510 if screen_height >= 720 else 230
-        )
+        """
+
+# Layout values that only depend on whether the desktop is at least 1280
+# wide / 720 tall; anything relative to the screen size is derived in
+# _build_skin
+_LAYOUT_WIDE = {
+    'art_x': 100, 'art_size': 400, 'no_art_font': 36,
+    'vis_x': 520, 'vis_w': 660, 'vis_h': 400,
+    'info_x': 100, 'info_margin': 200,
+    'title_font': 40, 'artist_font': 28, 'album_font': 24,
+    'time_total_margin': 250, 'progress_x': 320, 'progress_w': 640,
+    'volume_icon_x': 80, 'volume_text_x': 310, 'mode_margin': 180,
+    'spectrum_x': 530,
+}
+_LAYOUT_NARROW = {
+    'art_x': 50, 'art_size': 200, 'no_art_font': 24,
+    'vis_x': 270, 'vis_w': 480, 'vis_h': 200,
+    'info_x': 50, 'info_margin': 100,
+    'title_font': 28, 'artist_font': 20, 'album_font': 18,
+    'time_total_margin': 150, 'progress_x': 160, 'progress_w': 480,
+    'volume_icon_x': 30, 'volume_text_x': 210, 'mode_margin': 80,
+    'spectrum_x': 280,
+}
+_LAYOUT_TALL = {
+    'art_y': 100, 'title_y': 520, 'artist_y': 580, 'album_y': 620,
+    'time_y': 660, 'play_y': 680, 'ctrl_y': 700, 'volume_y': 700, 'eq_y': 510,
+}
+_LAYOUT_SHORT = {
+    'art_y': 50, 'title_y': 270, 'artist_y': 310, 'album_y': 340,
+    'time_y': 380, 'play_y': 300, 'ctrl_y': 310, 'volume_y': 380, 'eq_y': 230,
+}
+
+# Fixed layout parameters per (wide, tall) resolution class, merged once
+_LAYOUTS = {}
+for _wide, _width_layout in ((True, _LAYOUT_WIDE), (False, _LAYOUT_NARROW)):
+    for _tall, _height_layout in ((True, _LAYOUT_TALL), (False, _LAYOUT_SHORT)):
+        _layout = dict(_width_layout, **_height_layout)
+        for _i in range(10):
+            _layout['spectrum_%d_x' % _i] = _layout['spectrum_x'] + _i * 20
+        _LAYOUTS[_wide, _tall] = _layout
+
+@lru_cache(maxsize=4)
+def _build_skin(screen_width, screen_height):
+    """Generate player skin for the given desktop size"""
+    params = dict(_LAYOUTS[screen_width >= 1280, screen_height >= 720])
+    
+    center = screen_width // 2
+    params.update(
+        width=screen_width,
+        height=screen_height,
+        plugin_name=PLUGIN_NAME,
+        version=PLUGIN_VERSION,
+        info_w=screen_width - params['info_margin'],
+        time_total_x=screen_width - params['time_total_margin'],
+        mode_x=screen_width - params['mode_margin'],
+        play_x=center - 50,
+        prev_x=center - 140,
+        next_x=center + 80,
+        stop_x=center - 300,
+    )
+    
+    return _SKIN_TEMPLATE.format_map(params)
+
+# Full HD spectrum bar geometry: fixed x per bar, bars grow up from base y
+_SPECTRUM_BAR_X = tuple(530 + i * 20 for i in range(10))
+_SPECTRUM_BASE_Y = 510 + 180
+_SPECTRUM_HEIGHTS = range(20, 181)
+
+# Playlist files offered by the load dialog
+_M3U_PATTERN = re.compile(r".*\.m3u8?$", re.IGNORECASE)
+
+# File size units, each 1024 times the previous one
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
+# Progress and volume bar sizes for the detected resolution
+_PROGRESS_WIDTH, _PROGRESS_HEIGHT = (640, 10) if FULLHD else (480, 6)
+_VOLUME_WIDTH, _VOLUME_HEIGHT = (200, 30) if FULLHD else (150, 20)
+
+def _load_mp3(filepath):
+    """Open MP3 with easy ID3 tag keys when possible"""
+    MP3 = _lazy('mutagen.mp3').MP3
+    try:
+        return MP3(filepath, ID3=_lazy('mutagen.easyid3').EasyID3)
+    except:
+        return MP3(filepath)
+
+def _load_flac(filepath):
+    """Open FLAC file"""
+    return _lazy('mutagen.flac').FLAC(filepath)
+
+def _load_ogg(filepath):
+    """Open Ogg Vorbis file"""
+    return _lazy('mutagen.oggvorbis').OggVorbis(filepath)
+
+# Mutagen loader by lower-case file extension
+_TAG_LOADERS = {
+    '.mp3': _load_mp3,
+    '.flac': _load_flac,
+    '.ogg': _load_ogg,
+    '.oga': _load_ogg,
+}
+
+# (mutagen easy tag key, metadata key) pairs copied from tagged files
+_TAG_MAP = (
+    ('title', 'title'),
+    ('artist', 'artist'),
+    ('album', 'album'),
+    ('genre', 'genre'),
+    ('date', 'year'),
+    ('tracknumber', 'track'),
+)
+
+# Keyed by file identity so replays and shuffle revisits skip the parse
+@lru_cache(maxsize=512)
+def _read_audio_tags(filepath, mtime, size):
+    """Read stream info and tags with mutagen"""
+    info = {}
+    try:
+        loader = _TAG_LOADERS.get(os.path.splitext(filepath)[1].lower())
+        audio = loader(filepath) if loader else None
+        
+        stream = getattr(audio, 'info', None)
+        if stream is not None:
+            info['bitrate'] = (getattr(stream, 'bitrate', 0) or 0) // 1000
+            info['samplerate'] = getattr(stream, 'sample_rate', 0)
+            info['duration'] = getattr(stream, 'length', 0)
+        
+        # Extract tags if available
+        tags = getattr(audio, 'tags', None)
+        if tags:
+            for tag_key, metadata_key in _TAG_MAP:
+                value = tags.get(tag_key)
+                if value:
+                    info[metadata_key] = str(value[0])
+    
+    except Exception as mutagen_error:
+        debug_print("Mutagen metadata extraction error: %s" % str(mutagen_error))
+    
+    return MappingProxyType(info)
+
+# Whole seconds -> "MM:SS" / "HH:MM:SS"; the display repeats the same values
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds):
+    """Format whole seconds to MM:SS or HH:MM:SS"""
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours > 0:
+        return "%02d:%02d:%02d" % (hours, minutes, secs)
+    return "%02d:%02d" % (minutes, secs)
+
+# ============================================================================
+# WESTY AUDIO PLAYER CLASS
+# ============================================================================
+class WestyAudioPlayer(Screen):
+    """Advanced Audio Player with ID3 tag support and visualizations - v2.1.0"""
+    
+    # Playback state read on every timer tick lives in slots; Screen keeps
+    # its __dict__ for everything else
+    __slots__ = (
+        'is_playing', 'is_paused', 'volume', 'is_muted',
+        'repeat_mode', 'repeat_index', 'shuffle_mode', 'current_index',
+        'metadata', 'current_file', 'pending_tags',
+        'spectrum_bars', 'spectrum_heights', 'visualization_active',
+        'tick_timer', 'tick_count', 'rng', 'config_flush_ticks', 'seek_flush_ticks',
+        'last_render', 'progress_resize', 'spectrum_resizers', 'spectrum_movers',
+    )
+    
+    # Action name -> handler method name
+    ACTIONS = (
+        # Playback control
+        ("playpauseService", "togglePlayPause"),
+        ("stop", "stopPlayback"),
+        ("pause", "pausePlayback"),
+        ("play", "playPlayback"),
+        
+        # Navigation
+        ("nextBouquet", "nextTrack"),
+        ("prevBouquet", "prevTrack"),
+        ("seekBack", "rewind"),
+        ("seekFwd", "forward"),
+        
+        # Volume control
+        ("volumeUp", "volumeUp"),
+        ("volumeDown", "volumeDown"),
+        ("volumeMute", "toggleMute"),
+        
+        # Playback modes
+        ("info", "toggleRepeat"),
+        ("showEventInfo", "toggleShuffle"),
+        
+        # Color buttons
+        ("red", "showPlaylist"),
+        ("green", "togglePlayPause"),
+        ("yellow", "openEqualizer"),
+        ("blue", "toggleVisualization"),
+        
+        # Menu
+        ("menu", "openMenu"),
+        
+        # Exit
+        ("cancel", "exitPlayer"),
+        
+        # Audio specific
+        ("audioSelection", "openAudioSettings"),
+    )
+    
+    # Number key -> seek percentage
+    SEEK_KEYS = tuple((str(n), n * 10) for n in range(10))
+    
+    # Repeat modes in toggle order, with their play_mode symbols
+    REPEAT_MODES = ("none", "one", "all")
+    REPEAT_SYMBOLS = ("▶", "🔂", "🔁")
+    
+    # Dynamic skin based on screen size
+    @staticmethod
+    def get_skin():
+        """Generate skin based on desktop size"""
+        return _build_skin(DESKTOP_WIDTH, DESKTOP_HEIGHT)
     
     skin = get_skin()
     
     def __init__(self, session, audio_file=None, playlist=None):
+        Screen.__init__(self, session)
+        
+        self.session = session
+        self.audio_file = audio_file
+        self.playlist = playlist or []
+        self.current_index = 0
+        self.play_order = []  # shuffled playlist indices, built on demand
+        self.order_pos = 0
+        
+        # Load configuration
+        self.config = {}
+        if MEDIA_UTILS_AVAILABLE and media_config:
+            self.config = media_config.get_config('audioplayer')
+        
+        # Player state
+        self.is_playing = False
+        self.is_paused = False
+        self.volume = self.config.get('volume', 80)
+        self.is_muted = False
+        
+        # Playback modes
+        self.repeat_mode = self.config.get('repeat_mode', 'none')
+        if self.repeat_mode not in self.REPEAT_MODES:
+            self.repeat_mode = 'none'
+        self.repeat_index = self.REPEAT_MODES.index(self.repeat_mode)
+        self.shuffle_mode = self.config.get('shuffle', False)
+        self.equalizer_preset = self.config.get('equalizer_preset', 'normal')
+        
+        # Audio metadata
+        self.metadata = {}
+        self.album_art = None
+        self.art_cache = {}  # (path, mtime, size) -> temp art file, "" if none
+        self.current_file = None
+        self.pending_tags = None
+        # Background tag reads store their result only if no newer load
+        # started; the lock makes that check and store one step
+        self.tag_lock = threading.Lock()
+        self.tag_generation = 0
+        self.closed = False
+        
+        # Visualization
+        self.spectrum_bars = ()
+        self.spectrum_heights = []
+        self.rng = random.Random()
+        self.visualization_active = self.config.get('visualization', True)
+        
+        # One 50 ms tick timer drives spectrum, visualization and display
+        self.tick_timer = eTimer()
+        self.tick_count = 0
+        self.last_render = None  # (seconds, duration, progress width) last drawn
+        self.last_volume_render = None  # (muted, volume, bar resizable) last drawn
+        
+        # Config changes waiting to be written, flushed once keys settle
+        self.pending_config = {}
+        self.config_flush_ticks = 0
+        
+        # Held seek keys add up here and go to the service as one seek
+        self.pending_seek = 0
+        self.seek_flush_ticks = 0
+        
+        # Widget capabilities, known once the skin is applied (layoutFinished)
+        self.volume_resize = False
+        self.progress_resize = False
+        self.spectrum_resizers = ()
+        self.spectrum_movers = ()
+        
+        # Setup widgets
+        self.setupWidgets()
+        
+        # Setup actions
+        self.setupActions()
+        
+        # Setup service
+        self.setupService()
+        
+        # Initialize if file provided
+        if audio_file:
+            self.loadAudioFile(audio_file)
+        
+        # Start timer
         try:
-            Screen.__init__(self, session)
-            
-            self.session = session
-            self.audio_file = audio_file
-            self.playlist = playlist or []
-            self.current_index = 0
-            
-            # Load configuration
-            self.config = {}
-            if MEDIA_UTILS_AVAILABLE and media_config:
-                self.config = media_config.get_config('audioplayer')
-            
-            # Player state
-            self.is_playing = False
-            self.is_paused = False
-            self.volume = self.config.get('volume', 80)
-            self.is_muted = False
-            
-            # Playback modes
-            self.repeat_mode = self.config.get('repeat_mode', 'none')
-            self.shuffle_mode = self.config.get('shuffle', False)
-            self.equalizer_preset = self.config.get('equalizer_preset', 'normal')
-            
-            # Audio metadata
-            self.metadata = {}
-            self.album_art = None
-            
-            # Visualization
-            self.spectrum_bars = []
-            self.visualization_active = self.config.get('visualization', True)
-            
-            # Timers
-            self.update_timer = eTimer()
-            self.visualization_timer = eTimer()
-            self.spectrum_timer = eTimer()
-            
-            # Setup widgets
-            self.setupWidgets()
-            
-            # Setup actions
-            self.setupActions()
-            
-            # Setup service
-            self.setupService()
-            
-            # Initialize if file provided
-            if audio_file:
-                self.loadAudioFile(audio_file)
-            
-            # Start timers
-            if hasattr(self.update_timer, 'timeout'):
-                self.update_timer.timeout.get().append(self.updateDisplay)
-                self.update_timer.start(500)
-            
-            if hasattr(self.visualization_timer, 'timeout'):
-                self.visualization_timer.timeout.get().append(self.updateVisualization)
-                self.visualization_timer.start(100)
-            
-            if hasattr(self.spectrum_timer, 'timeout'):
-                self.spectrum_timer.timeout.get().append(self.updateSpectrum)
-                self.spectrum_timer.start(50)
-            
-            self.onClose.append(self.cleanup)
-            
-            debug_print("WestyAudioPlayer v%s: Initialized" % PLUGIN_VERSION)
-            
+            if hasattr(self.tick_timer, 'timeout'):
+                self.tick_timer.timeout.get().append(self.onTick)
+                self.tick_timer.start(50)
         except Exception as e:
-            debug_print("AudioPlayer init error: %s" % str(e))
-            import traceback
-            traceback.print_exc()
+            debug_print("AudioPlayer timer setup error: %s" % str(e))
+        
+        self.onLayoutFinish.append(self.layoutFinished)
+        self.onClose.append(self.cleanup)
+        
+        debug_print("WestyAudioPlayer v%s: Initialized" % PLUGIN_VERSION)
     
     def setupWidgets(self):
         """Setup all screen widgets"""
@@ -691,12 +874,16 @@ class WestyAudioPlayer(Screen):
             self["visualizer"] = Pixmap()
             self["eq_display"] = Pixmap()
             
-            # Spectrum analyzer bars
+            # Spectrum analyzer bars, kept as a tuple of widgets plus a
+            # parallel list of the heights last drawn
+            bars = []
             for i in range(10):
-                widget_name = "spectrum_%d" % i
-                self[widget_name] = Pixmap()
-                self[widget_name].hide()
-                self.spectrum_bars.append(self[widget_name])
+                bar = Pixmap()
+                self["spectrum_%d" % i] = bar
+                bar.hide()
+                bars.append(bar)
+            self.spectrum_bars = tuple(bars)
+            self.spectrum_heights = [0] * len(bars)
             
             # Key labels
             self["key_red"] = StaticText(_("Playlist"))
@@ -717,56 +904,14 @@ class WestyAudioPlayer(Screen):
     def setupActions(self):
         """Setup action map"""
         try:
+            actions = {key: getattr(self, method) for key, method in self.ACTIONS}
+            
+            # Number keys for quick jump
+            for key, percentage in self.SEEK_KEYS:
+                actions[key] = partial(self.seekToPercentage, percentage)
+            
             self["actions"] = HelpableActionMap(self, ["WestyAudioPlayerActions", "ColorActions", "MediaPlayerActions"],
-            {
-                # Playback control
-                "playpauseService": self.togglePlayPause,
-                "stop": self.stopPlayback,
-                "pause": self.pausePlayback,
-                "play": self.playPlayback,
-                
-                # Navigation
-                "nextBouquet": self.nextTrack,
-                "prevBouquet": self.prevTrack,
-                "seekBack": self.rewind,
-                "seekFwd": self.forward,
-                
-                # Volume control
-                "volumeUp": self.volumeUp,
-                "volumeDown": self.volumeDown,
-                "volumeMute": self.toggleMute,
-                
-                # Playback modes
-                "info": self.toggleRepeat,
-                "showEventInfo": self.toggleShuffle,
-                
-                # Color buttons
-                "red": self.showPlaylist,
-                "green": self.togglePlayPause,
-                "yellow": self.openEqualizer,
-                "blue": self.toggleVisualization,
-                
-                # Menu
-                "menu": self.openMenu,
-                
-                # Exit
-                "cancel": self.exitPlayer,
-                
-                # Audio specific
-                "audioSelection": self.openAudioSettings,
-                
-                # Number keys for quick jump
-                "1": lambda: self.seekToPercentage(10),
-                "2": lambda: self.seekToPercentage(20),
-                "3": lambda: self.seekToPercentage(30),
-                "4": lambda: self.seekToPercentage(40),
-                "5": lambda: self.seekToPercentage(50),
-                "6": lambda: self.seekToPercentage(60),
-                "7": lambda: self.seekToPercentage(70),
-                "8": lambda: self.seekToPercentage(80),
-                "9": lambda: self.seekToPercentage(90),
-                "0": lambda: self.seekToPercentage(0),
-            }, -1)
+                                                actions, -1)
             
         except Exception as e:
             debug_print("setupActions error: %s" % str(e))
@@ -784,20 +929,25 @@ class WestyAudioPlayer(Screen):
     def loadAudioFile(self, filepath):
         """Load audio file and extract metadata"""
         try:
-            if not os.path.exists(filepath):
+            # A seek queued for the previous track must not hit this one
+            self.pending_seek = 0
+            self.seek_flush_ticks = 0
+            
+            # One stat serves both the existence check and the file info
+            try:
+                file_stat = os.stat(filepath)
+            except OSError:
                 self.showError(_("File not found: %s") % filepath)
                 return
             
             # Extract metadata
-            self.extractMetadata(filepath)
+            self.extractMetadata(filepath, file_stat)
             
             # Update display with metadata
             self.updateMetadataDisplay()
             
-            # Try to extract album art
-            if MUTAGEN_AVAILABLE:
-                self.extractAlbumArt(filepath)
-            else:
+            # Album art is extracted with the tags in the background
+            if not MUTAGEN_AVAILABLE:
                 self["no_art_label"].show()
                 debug_print("Mutagen not installed for album art extraction")
             
@@ -815,11 +965,12 @@ class WestyAudioPlayer(Screen):
             debug_print("loadAudioFile error: %s" % str(e))
             self.showError(_("Error loading audio file"))
     
-    def extractMetadata(self, filepath):
-        """Extract audio metadata using mutagen or basic file info"""
+    def extractMetadata(self, filepath, file_stat=None):
+        """Extract basic file info and start reading tags in the background"""
         try:
             # Start with basic info
             filename = os.path.basename(filepath)
+            self.current_file = filepath
             
             self.metadata = {
                 'title': filename,
@@ -836,72 +987,29 @@ class WestyAudioPlayer(Screen):
             }
             
             # Get basic file info
-            if os.path.exists(filepath):
-                import stat
-                file_stat = os.stat(filepath)
+            if file_stat is None:
+                try:
+                    file_stat = os.stat(filepath)
+                except OSError:
+                    pass
+            if file_stat is not None:
                 self.metadata['filesize'] = file_stat.st_size
                 self.metadata['modified'] = time.ctime(file_stat.st_mtime)
             else:
                 self.metadata['filesize'] = 0
                 self.metadata['modified'] = _("Unknown")
             
-            # Use mutagen if available for detailed metadata
-            if MUTAGEN_AVAILABLE:
-                try:
-                    audio = None
-                    file_ext = filepath.lower()
-                    
-                    # Load based on file type
-                    if file_ext.endswith('.mp3'):
-                        try:
-                            audio = MP3(filepath, ID3=EasyID3)
-                        except:
-                            audio = MP3(filepath)
-                        
-                        if hasattr(audio, 'info'):
-                            self.metadata['bitrate'] = audio.info.bitrate // 1000 if hasattr(audio.info, 'bitrate') else 0
-                            self.metadata['samplerate'] = audio.info.sample_rate if hasattr(audio.info, 'sample_rate') else 0
-                            self.metadata['duration'] = audio.info.length if hasattr(audio.info, 'length') else 0
-                    
-                    elif file_ext.endswith('.flac'):
-                        try:
-                            audio = FLAC(filepath)
-                            if hasattr(audio, 'info'):
-                                self.metadata['bitrate'] = audio.info.bitrate // 1000 if audio.info.bitrate else 0
-                                self.metadata['samplerate'] = audio.info.sample_rate
-                                self.metadata['duration'] = audio.info.length
-                        except:
-                            pass
-                    
-                    elif file_ext.endswith(('.ogg', '.oga')):
-                        try:
-                            audio = OggVorbis(filepath)
-                            if hasattr(audio, 'info'):
-                                self.metadata['bitrate'] = audio.info.bitrate // 1000
-                                self.metadata['samplerate'] = audio.info.sample_rate
-                                self.metadata['duration'] = audio.info.length
-                        except:
-                            pass
-                    
-                    # Extract tags if available
-                    if audio and hasattr(audio, 'tags'):
-                        tags = audio.tags
-                        
-                        if 'title' in tags:
-                            self.metadata['title'] = str(tags['title'][0])
-                        if 'artist' in tags:
-                            self.metadata['artist'] = str(tags['artist'][0])
-                        if 'album' in tags:
-                            self.metadata['album'] = str(tags['album'][0])
-                        if 'genre' in tags:
-                            self.metadata['genre'] = str(tags['genre'][0])
-                        if 'date' in tags:
-                            self.metadata['year'] = str(tags['date'][0])
-                        if 'tracknumber' in tags:
-                            self.metadata['track'] = str(tags['tracknumber'][0])
-                
-                except Exception as mutagen_error:
-                    debug_print("Mutagen metadata extraction error: %s" % str(mutagen_error))
+            # Tag parsing can block for seconds on USB/HDD storage, so run it
+            # off the UI thread; updateDisplay merges the result when ready
+            with self.tag_lock:
+                self.tag_generation += 1
+                generation = self.tag_generation
+                self.pending_tags = None
+            if MUTAGEN_AVAILABLE and file_stat is not None:
+                tag_thread = threading.Thread(target=self._readTags,
+                                              args=(filepath, file_stat.st_mtime, file_stat.st_size, generation))
+                tag_thread.daemon = True
+                tag_thread.start()
             
             # Sanitize title using media utilities if available
             if MEDIA_UTILS_AVAILABLE:
@@ -912,44 +1020,102 @@ class WestyAudioPlayer(Screen):
         except Exception as e:
             debug_print("extractMetadata error: %s" % str(e))
     
-    def extractAlbumArt(self, filepath):
-        """Extract album art from audio file"""
+    def _readTags(self, filepath, mtime, size, generation):
+        """Read tags and album art for filepath (background thread)"""
+        if generation != self.tag_generation:
+            return
+        info = _read_audio_tags(filepath, mtime, size)
+        art_path = self.extractAlbumArt(filepath, mtime, size)
+        # Picked up by the UI thread in updateDisplay; a load that finishes
+        # after a newer one started must not replace the newer result
+        with self.tag_lock:
+            if generation == self.tag_generation:
+                self.pending_tags = (filepath, info, art_path)
+    
+    def applyPendingTags(self):
+        """Merge tags read in the background into the current metadata"""
         try:
-            if not MUTAGEN_AVAILABLE:
+            filepath, info, art_path = self.pending_tags
+            self.pending_tags = None
+            
+            # Drop results for a track that is no longer loaded
+            if filepath != self.current_file:
                 return
-                
-            # Only for MP3 files with ID3 tags
-            if filepath.lower().endswith('.mp3'):
+            
+            if info:
+                self.metadata.update(info)
+                if MEDIA_UTILS_AVAILABLE and 'title' in info:
+                    self.metadata['title'] = media_utils.sanitize_filename(self.metadata['title'])
+                self.updateMetadataDisplay()
+            
+            if art_path:
+                self.showAlbumArt(art_path)
+            debug_print("Applied tags for: %s" % os.path.basename(filepath))
+            
+        except Exception as e:
+            debug_print("applyPendingTags error: %s" % str(e))
+    
+    def extractAlbumArt(self, filepath, mtime, size):
+        """Write embedded album art to a temp file and return its path"""
+        # Only for MP3 files with ID3 tags
+        if not filepath.lower().endswith('.mp3'):
+            return ""
+        
+        if self.closed:
+            return ""
+        
+        cache_key = (filepath, mtime, size)
+        with self.tag_lock:
+            art_path = self.art_cache.get(cache_key)
+        if art_path is not None:
+            return art_path
+        
+        art_path = ""
+        try:
+            # Only the APIC frames are needed: skip frame translation and
+            # the ID3v1 tail read
+            audio = _lazy('mutagen.id3').ID3(filepath, translate=False, load_v1=False)
+            apics = audio.getall('APIC')
+            if apics:
+                # Save album art to temp file
+                fd, art_path = tempfile.mkstemp(suffix='.jpg')
                 try:
-                    audio = ID3(filepath)
-                    for tag in audio.values():
-                        if tag.FrameID == 'APIC':  # Album art
-                            # Save album art to temp file
-                            import tempfile
-                            art_data = tag.data
-                            temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-                            temp_file.write(art_data)
-                            temp_file.close()
-                            
-                            self.album_art = temp_file.name
-                            
-                            # Try to load into pixmap
-                            try:
-                                from Tools.LoadPixmap import LoadPixmap
-                                pixmap = LoadPixmap(self.album_art)
-                                if pixmap:
-                                    self["album_art"].instance.setPixmap(pixmap)
-                                    self["no_art_label"].hide()
-                                    debug_print("Loaded album art")
-                                    break
-                            except ImportError:
-                                debug_print("LoadPixmap not available")
-                
-                except Exception as id3_error:
-                    debug_print("ID3 album art extraction error: %s" % str(id3_error))
+                    os.write(fd, apics[0].data)
+                finally:
+                    os.close(fd)
+        except Exception as id3_error:
+            debug_print("ID3 album art extraction error: %s" % str(id3_error))
+        
+        with self.tag_lock:
+            if not self.closed:
+                self.art_cache[cache_key] = art_path
+                return art_path
+        # The screen was cleaned up while this file was being written
+        if art_path:
+            try:
+                os.unlink(art_path)
+            except OSError:
+                pass
+        return ""
+    
+    def showAlbumArt(self, art_path):
+        """Show album art image file"""
+        try:
+            self.album_art = art_path
+            
+            # Try to load into pixmap
+            if LoadPixmap is None:
+                debug_print("LoadPixmap not available")
+                return
+            
+            pixmap = LoadPixmap(art_path)
+            if pixmap:
+                self["album_art"].instance.setPixmap(pixmap)
+                self["no_art_label"].hide()
+                debug_print("Loaded album art")
             
         except Exception as e:
-            debug_print("extractAlbumArt error: %s" % str(e))
+            debug_print("showAlbumArt error: %s" % str(e))
     
     def updateMetadataDisplay(self):
         """Update display with current metadata"""
@@ -962,18 +1128,17 @@ class WestyAudioPlayer(Screen):
             self["artist_label"].setText(artist)
             self["album_label"].setText(album)
             
-            # Update window title
-            display_title = "%s - %s" % (artist, title) if artist else title
-            
-            if len(display_title) > 50:
-                display_title = display_title[:47] + "..."
-            
             # Set screen title with plugin version
             full_title = "%s Audio Player v%s" % (PLUGIN_NAME, PLUGIN_VERSION)
             if hasattr(self, 'setTitle'):
                 self.setTitle(full_title)
             
-            debug_print("Display updated: %s" % display_title)
+            # The short "artist - title" form is only used for logging
+            if DEBUG:
+                display_title = "%s - %s" % (artist, title) if artist else title
+                if len(display_title) > 50:
+                    display_title = display_title[:47] + "..."
+                debug_print("Display updated: %s" % display_title)
             
         except Exception as e:
             debug_print("updateMetadataDisplay error: %s" % str(e))
@@ -1069,8 +1234,7 @@ class WestyAudioPlayer(Screen):
         try:
             if self.playlist and len(self.playlist) > 1:
                 if self.shuffle_mode:
-                    import random
-                    self.current_index = random.randint(0, len(self.playlist) - 1)
+                    self.stepShuffle(1)
                 else:
                     self.current_index = (self.current_index + 1) % len(self.playlist)
                 
@@ -1083,16 +1247,32 @@ class WestyAudioPlayer(Screen):
         """Play previous track in playlist"""
         try:
             if self.playlist and len(self.playlist) > 1:
-                self.current_index = (self.current_index - 1) % len(self.playlist)
+                if self.shuffle_mode:
+                    self.stepShuffle(-1)
+                else:
+                    self.current_index = (self.current_index - 1) % len(self.playlist)
                 self.loadAudioFile(self.playlist[self.current_index])
                 debug_print("Previous track: %d" % self.current_index)
         except Exception as e:
             debug_print("prevTrack error: %s" % str(e))
     
+    def stepShuffle(self, step):
+        """Move through the shuffled play order"""
+        order = self.play_order
+        if len(order) != len(self.playlist):
+            # Shuffle once per playlist, starting from the current track
+            order = self.play_order = list(range(len(self.playlist)))
+            self.rng.shuffle(order)
+            current = order.index(self.current_index)
+            order[0], order[current] = order[current], order[0]
+            self.order_pos = 0
+        self.order_pos = (self.order_pos + step) % len(order)
+        self.current_index = order[self.order_pos]
+    
     def rewind(self):
         """Rewind 5 seconds"""
         try:
-            self.seekRelative(-5)
+            self.scheduleSeek(-5)
             debug_print("Rewind 5 seconds")
         except Exception as e:
             debug_print("rewind error: %s" % str(e))
@@ -1100,52 +1280,70 @@ class WestyAudioPlayer(Screen):
     def forward(self):
         """Forward 5 seconds"""
         try:
-            self.seekRelative(5)
+            self.scheduleSeek(5)
             debug_print("Forward 5 seconds")
         except Exception as e:
             debug_print("forward error: %s" % str(e))
     
+    def scheduleSeek(self, seconds):
+        """Queue a relative seek, coalescing key repeats into one"""
+        self.pending_seek += seconds
+        # Seek 150 ms (3 ticks) after the last press
+        self.seek_flush_ticks = 3
+    
+    def flushSeek(self):
+        """Issue the queued relative seek"""
+        seconds = self.pending_seek
+        self.pending_seek = 0
+        self.seek_flush_ticks = 0
+        if seconds:
+            self.seekRelative(seconds)
+    
+    def getSeek(self):
+        """Return the seek interface of the running service, or None"""
+        if ENIGMA_CORE_AVAILABLE and hasattr(self.session, 'nav'):
+            service = self.session.nav.getCurrentService()
+            if service:
+                return service.seek()
+        return None
+    
     def seekRelative(self, seconds):
         """Seek relative to current position"""
         try:
-            if ENIGMA_CORE_AVAILABLE and hasattr(self.session, 'nav'):
-                service = self.session.nav.getCurrentService()
-                if service:
-                    seek = service.seek()
-                    if seek:
-                        position = seek.getPlayPosition()
-                        if position and position[0]:
-                            new_position = position[1] + (seconds * 90000)
-                            seek.seekTo(new_position)
-                            debug_print("Seek relative: %d seconds" % seconds)
+            seek = self.getSeek()
+            if not seek:
+                return
+            # Enigma returns (error, pts); error is 0 on success
+            position = seek.getPlayPosition()
+            if not position or position[0]:
+                return
+            seek.seekTo(position[1] + seconds * 90000)
+            debug_print("Seek relative: %d seconds" % seconds)
         except Exception as e:
             debug_print("seekRelative error: %s" % str(e))
     
     def seekToPercentage(self, percentage):
         """Seek to percentage of track"""
         try:
-            if ENIGMA_CORE_AVAILABLE and hasattr(self.session, 'nav'):
-                service = self.session.nav.getCurrentService()
-                if service:
-                    seek = service.seek()
-                    if seek:
-                        length = seek.getLength()
-                        if length and length[0]:
-                            position = (length[1] * percentage) // 100
-                            seek.seekTo(position)
-                            debug_print("Seek to: %d%%" % percentage)
+            seek = self.getSeek()
+            if not seek:
+                return
+            length = seek.getLength()
+            if not length or length[0]:
+                return
+            seek.seekTo(length[1] * percentage // 100)
+            debug_print("Seek to: %d%%" % percentage)
         except Exception as e:
             debug_print("seekToPercentage error: %s" % str(e))
     
     def volumeUp(self):
         """Increase volume"""
         try:
-            self.volume = min(100, self.volume + 5)
+            self.volume = self.volume + 5 if self.volume < 95 else 100
             self.updateVolumeDisplay()
             
             # Update configuration
-            if MEDIA_UTILS_AVAILABLE:
-                media_config.set_config('audioplayer', 'volume', self.volume)
+            self.scheduleConfigSave('volume', self.volume)
             
             debug_print("Volume up: %d%%" % self.volume)
         except Exception as e:
@@ -1154,12 +1352,11 @@ class WestyAudioPlayer(Screen):
     def volumeDown(self):
         """Decrease volume"""
         try:
-            self.volume = max(0, self.volume - 5)
+            self.volume = self.volume - 5 if self.volume > 5 else 0
             self.updateVolumeDisplay()
             
             # Update configuration
-            if MEDIA_UTILS_AVAILABLE:
-                media_config.set_config('audioplayer', 'volume', self.volume)
+            self.scheduleConfigSave('volume', self.volume)
             
             debug_print("Volume down: %d%%" % self.volume)
         except Exception as e:
@@ -1174,35 +1371,76 @@ class WestyAudioPlayer(Screen):
         except Exception as e:
             debug_print("toggleMute error: %s" % str(e))
     
+    def scheduleConfigSave(self, key, value):
+        """Queue a config write, coalescing rapid repeats into one"""
+        self.pending_config[key] = value
+        # Write 500 ms (10 ticks) after the last change
+        self.config_flush_ticks = 10
+    
+    def layoutFinished(self):
+        """Check widget capabilities once the skin instances exist"""
+        try:
+            self.volume_resize = hasattr(self["volume_level"].instance, 'resize')
+            self.progress_resize = hasattr(self["progress"].instance, 'resize')
+            # Bound per-bar methods, so the spectrum loop skips bar.instance.*
+            instances = [bar.instance for bar in self.spectrum_bars]
+            if all(hasattr(instance, 'resize') for instance in instances):
+                self.spectrum_resizers = tuple(instance.resize for instance in instances)
+            if FULLHD and all(hasattr(instance, 'move') for instance in instances):
+                self.spectrum_movers = tuple(instance.move for instance in instances)
+            self.updateVolumeDisplay()
+        except Exception as e:
+            debug_print("layoutFinished error: %s" % str(e))
+    
+    def flushConfig(self):
+        """Write queued config changes"""
+        try:
+            self.config_flush_ticks = 0
+            if not self.pending_config:
+                return
+            
+            if MEDIA_UTILS_AVAILABLE:
+                # self.config is the live audioplayer section, so values
+                # toggled back to what is stored need no write
+                config = self.config
+                for key, value in self.pending_config.items():
+                    if config.get(key) != value:
+                        media_config.set_config('audioplayer', key, value)
+            self.pending_config.clear()
+        except Exception as e:
+            debug_print("flushConfig error: %s" % str(e))
+    
     def updateVolumeDisplay(self):
         """Update volume display"""
         try:
+            # Key repeats at the 0/100 limits and re-mutes change nothing
+            render = (self.is_muted, self.volume, self.volume_resize)
+            if render == self.last_volume_render:
+                return
+            self.last_volume_render = render
+            
             if self.is_muted:
                 self["volume_text"].setText(_("Muted"))
-                if hasattr(self["volume_level"].instance, 'resize'):
-                    self["volume_level"].instance.resize(0, 30 if FULLHD else 20)
+                if self.volume_resize:
+                    self["volume_level"].instance.resize(0, _VOLUME_HEIGHT)
             else:
                 self["volume_text"].setText("%d%%" % self.volume)
-                if hasattr(self["volume_level"].instance, 'resize'):
-                    width = int(200 * (self.volume / 100)) if FULLHD else int(150 * (self.volume / 100))
-                    self["volume_level"].instance.resize(width, 30 if FULLHD else 20)
+                if self.volume_resize:
+                    self["volume_level"].instance.resize(_VOLUME_WIDTH * self.volume // 100, _VOLUME_HEIGHT)
         except Exception as e:
             debug_print("updateVolumeDisplay error: %s" % str(e))
     
     def toggleRepeat(self):
         """Toggle repeat mode"""
         try:
-            modes = ["none", "one", "all"]
-            current_index = modes.index(self.repeat_mode) if self.repeat_mode in modes else 0
-            self.repeat_mode = modes[(current_index + 1) % len(modes)]
+            index = self.repeat_index = (self.repeat_index + 1) % 3
+            self.repeat_mode = self.REPEAT_MODES[index]
             
             # Update display
-            repeat_symbols = {"none": "▶", "one": "🔂", "all": "🔁"}
-            self["play_mode"].setText(repeat_symbols.get(self.repeat_mode, "▶"))
+            self["play_mode"].setText(self.REPEAT_SYMBOLS[index])
             
             # Update configuration
-            if MEDIA_UTILS_AVAILABLE:
-                media_config.set_config('audioplayer', 'repeat_mode', self.repeat_mode)
+            self.scheduleConfigSave('repeat_mode', self.repeat_mode)
             
             self.showMessage(_("Repeat: %s") % self.repeat_mode)
             debug_print("Repeat mode: %s" % self.repeat_mode)
@@ -1214,13 +1452,14 @@ class WestyAudioPlayer(Screen):
         """Toggle shuffle mode"""
         try:
             self.shuffle_mode = not self.shuffle_mode
+            # Reshuffle from the current track next time
+            self.play_order = []
             
             # Update display
             self["play_mode"].setText("🔀" if self.shuffle_mode else "▶")
             
             # Update configuration
-            if MEDIA_UTILS_AVAILABLE:
-                media_config.set_config('audioplayer', 'shuffle', self.shuffle_mode)
+            self.scheduleConfigSave('shuffle', self.shuffle_mode)
             
             mode = _("On") if self.shuffle_mode else _("Off")
             self.showMessage(_("Shuffle: %s") % mode)
@@ -1235,8 +1474,7 @@ class WestyAudioPlayer(Screen):
             self.visualization_active = not self.visualization_active
             
             # Update configuration
-            if MEDIA_UTILS_AVAILABLE:
-                media_config.set_config('audioplayer', 'visualization', self.visualization_active)
+            self.scheduleConfigSave('visualization', self.visualization_active)
             
             if self.visualization_active:
                 self["visualizer"].show()
@@ -1254,108 +1492,112 @@ class WestyAudioPlayer(Screen):
         except Exception as e:
             debug_print("toggleVisualization error: %s" % str(e))
     
+    def onTick(self):
+        """Dispatch periodic updates from the 50 ms timer"""
+        try:
+            # Spectrum every tick, visualization every 100 ms, display every 500 ms
+            count = self.tick_count = (self.tick_count + 1) % 10
+            if self.config_flush_ticks:
+                self.config_flush_ticks -= 1
+                if not self.config_flush_ticks:
+                    self.flushConfig()
+            if self.seek_flush_ticks:
+                self.seek_flush_ticks -= 1
+                if not self.seek_flush_ticks:
+                    self.flushSeek()
+            # The tick handlers have no try of their own; errors land here
+            if not count:
+                self.updateDisplay()
+            # Hidden or idle visualization costs nothing per tick
+            if self.visualization_active and self.is_playing and not self.is_paused:
+                self.updateSpectrum()
+                if not count & 1:
+                    self.updateVisualization()
+        except Exception as e:
+            debug_print("onTick error: %s" % str(e))
+    
     def updateDisplay(self):
         """Update time and progress display"""
-        try:
-            if not self.is_playing or self.is_paused:
+        if self.pending_tags is not None:
+            self.applyPendingTags()
+        
+        if not self.is_playing or self.is_paused:
+            return
+        
+        duration = self.metadata.get('duration', 0)
+        if duration > 0:
+            # Simulate playback progress for demo
+            # In real implementation, would get actual position from service
+            current_time = time.time() % duration if duration > 0 else 0
+            width = int(_PROGRESS_WIDTH * current_time / duration)
+            
+            # Skip the repaint when neither label nor bar would change
+            render = (int(current_time), int(duration), width)
+            if render == self.last_render:
                 return
+            self.last_render = render
             
-            duration = self.metadata.get('duration', 0)
-            if duration > 0:
-                # Simulate playback progress for demo
-                # In real implementation, would get actual position from service
-                current_time = time.time() % duration if duration > 0 else 0
-                
-                # Update time labels
-                self["time_current"].setText(self.formatTime(current_time))
-                self["time_total"].setText(self.formatTime(duration))
-                
-                # Update progress bar
-                if duration > 0:
-                    progress = (current_time / duration) * 100
-                    progress_width = 640 if FULLHD else 480
-                    width = int(progress_width * (progress / 100))
-                    if hasattr(self["progress"].instance, 'resize'):
-                        self["progress"].instance.resize(width, 10 if FULLHD else 6)
+            # Update time labels
+            self["time_current"].setText(self.formatTime(current_time))
+            self["time_total"].setText(self.formatTime(duration))
             
-        except Exception as e:
-            debug_print("updateDisplay error: %s" % str(e))
+            # Update progress bar
+            if self.progress_resize:
+                self["progress"].instance.resize(width, _PROGRESS_HEIGHT)
     
     def formatTime(self, seconds):
         """Format seconds to MM:SS or HH:MM:SS"""
         try:
-            if seconds < 0:
-                return "00:00"
-            
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            
-            if hours > 0:
-                return "%02d:%02d:%02d" % (hours, minutes, secs)
-            else:
-                return "%02d:%02d" % (minutes, secs)
-                
+            return _format_seconds(max(0, int(seconds)))
         except Exception as e:
             debug_print("formatTime error: %s" % str(e))
             return "00:00"
     
     def updateVisualization(self):
         """Update visualization display"""
-        try:
-            if not self.visualization_active or not self.is_playing or self.is_paused:
-                return
-            
-            # In real implementation, would use audio data for visualization
-            # For now, create simple animation
-            pass
-            
-        except Exception as e:
-            debug_print("updateVisualization error: %s" % str(e))
+        # In real implementation, would use audio data for visualization
+        # For now, create simple animation
+        pass
     
     def updateSpectrum(self):
         """Update spectrum analyzer bars"""
-        try:
-            if not self.visualization_active or not self.is_playing or self.is_paused:
-                return
-            
-            import random
+        # Random heights for demo (would use FFT in real implementation)
+        heights = self.rng.choices(_SPECTRUM_HEIGHTS, k=len(self.spectrum_bars))
+        last_heights = self.spectrum_heights
+        self.spectrum_heights = heights
+        
+        resizers = self.spectrum_resizers
+        movers = self.spectrum_movers
+        for i, height in enumerate(heights):
+            # Only touch bars whose height actually changed
+            if height == last_heights[i]:
+                continue
             
-            for i, bar in enumerate(self.spectrum_bars):
-                # Random height for demo (would use FFT in real implementation)
-                height = random.randint(20, 180)
-                if hasattr(bar.instance, 'resize'):
-                    bar.instance.resize(10, height)
-                
-                # Position from bottom
-                if FULLHD:
-                    y_pos = 510 + (180 - height)
-                    if hasattr(bar.instance, 'move'):
-                        from enigma import ePoint
-                        bar.instance.move(ePoint(530 + (i * 20), y_pos))
+            if resizers:
+                resizers[i](10, height)
             
-        except Exception as e:
-            debug_print("updateSpectrum error: %s" % str(e))
+            # Position from bottom
+            if movers:
+                movers[i](ePoint(_SPECTRUM_BAR_X[i], _SPECTRUM_BASE_Y - height))
     
     def showPlaylist(self):
         """Show playlist browser"""
         try:
             if self.playlist:
-                # Try to import playlist browser
-                try:
-                    from .PlaylistBrowser import WestyAudioPlaylistBrowser
-                    self.session.open(WestyAudioPlaylistBrowser, self.playlist, self.current_index)
-                except ImportError:
+                browser = _optional_screen('PlaylistBrowser', 'WestyAudioPlaylistBrowser')
+                if browser:
+                    self.session.open(browser, self.playlist, self.current_index)
+                else:
                     # Show simple playlist dialog
-                    from Screens.MessageBox import MessageBox
-                    playlist_text = _("Playlist (%d tracks):\n\n") % len(self.playlist)
+                    basename = os.path.basename
+                    parts = [_("Playlist (%d tracks):\n\n") % len(self.playlist)]
                     for i, track in enumerate(self.playlist[:10]):
-                        name = os.path.basename(track)
                         prefix = "▶ " if i == self.current_index else "%d. " % (i+1)
-                        playlist_text += "%s%s\n" % (prefix, name)
+                        parts.append("%s%s\n" % (prefix, basename(track)))
                     
                     if len(self.playlist) > 10:
-                        playlist_text += _("\n... and %d more") % (len(self.playlist) - 10)
+                        parts.append(_("\n... and %d more") % (len(self.playlist) - 10))
+                    playlist_text = "".join(parts)
                     
                     self.session.open(MessageBox, playlist_text, MessageBox.TYPE_INFO)
             
@@ -1365,11 +1607,10 @@ class WestyAudioPlayer(Screen):
     def openEqualizer(self):
         """Open audio equalizer"""
         try:
-            # Try to import equalizer
-            try:
-                from .Equalizer import WestyAudioEqualizer
-                self.session.openWithCallback(self.equalizerCallback, WestyAudioEqualizer, self.equalizer_preset)
-            except ImportError:
+            equalizer = _optional_screen('Equalizer', 'WestyAudioEqualizer')
+            if equalizer:
+                self.session.openWithCallback(self.equalizerCallback, equalizer, self.equalizer_preset)
+            else:
                 self.showMessage(_("Equalizer feature requires additional files"))
         except Exception as e:
             debug_print("openEqualizer error: %s" % str(e))
@@ -1382,8 +1623,7 @@ class WestyAudioPlayer(Screen):
                 self.equalizer_preset = preset
                 
                 # Update configuration
-                if MEDIA_UTILS_AVAILABLE:
-                    media_config.set_config('audioplayer', 'equalizer_preset', preset)
+                self.scheduleConfigSave('equalizer_preset', preset)
                 
                 self.showMessage(_("Equalizer preset: %s") % preset)
                 debug_print("Equalizer preset set to: %s" % preset)
@@ -1393,11 +1633,10 @@ class WestyAudioPlayer(Screen):
     def openAudioSettings(self):
         """Open audio settings"""
         try:
-            # Try to import audio settings
-            try:
-                from .AudioSettings import WestyAudioSettings
-                self.session.open(WestyAudioSettings)
-            except ImportError:
+            settings = _optional_screen('AudioSettings', 'WestyAudioSettings')
+            if settings:
+                self.session.open(settings)
+            else:
                 self.showMessage(_("Audio settings not available"))
         except Exception as e:
             debug_print("openAudioSettings error: %s" % str(e))
@@ -1406,8 +1645,6 @@ class WestyAudioPlayer(Screen):
     def openMenu(self):
         """Open audio player menu"""
         try:
-            from Screens.ChoiceBox import ChoiceBox
-            
             menu = []
             
             if self.playlist:
@@ -1448,11 +1685,10 @@ class WestyAudioPlayer(Screen):
     def editPlaylist(self):
         """Edit current playlist"""
         try:
-            # Try to import playlist editor
-            try:
-                from .PlaylistEditor import WestyPlaylistEditor
-                self.session.open(WestyPlaylistEditor, self.playlist)
-            except ImportError:
+            editor = _optional_screen('PlaylistEditor', 'WestyPlaylistEditor')
+            if editor:
+                self.session.open(editor, self.playlist)
+            else:
                 self.showMessage(_("Playlist editor not available"))
         except Exception as e:
             debug_print("editPlaylist error: %s" % str(e))
@@ -1460,8 +1696,6 @@ class WestyAudioPlayer(Screen):
     def showFileInfo(self):
         """Show detailed file information"""
         try:
-            from Screens.MessageBox import MessageBox
-            
             info_lines = []
             
             info_lines.append(_("File: %s") % self.metadata.get('title', ''))
@@ -1487,11 +1721,9 @@ class WestyAudioPlayer(Screen):
             if self.metadata.get('filesize'):
                 # Format file size
                 size = self.metadata['filesize']
-                for unit in ['B', 'KB', 'MB', 'GB']:
-                    if size < 1024.0:
-                        info_lines.append(_("Size: %.1f %s") % (size, unit))
-                        break
-                    size /= 1024.0
+                # Unit index straight from the bit length: 10 bits per step
+                index = min(3, (int(size).bit_length() - 1) // 10)
+                info_lines.append(_("Size: %.1f %s") % (size / (1 << (index * 10)), _SIZE_UNITS[index]))
             
             info_lines.append(_("Format: %s") % self.metadata.get('filetype', '').upper().replace('.', ''))
             info_lines.append(_("Modified: %s") % self.metadata.get('modified', ''))
@@ -1506,7 +1738,6 @@ class WestyAudioPlayer(Screen):
     def setSleepTimer(self):
         """Set sleep timer"""
         try:
-            from Screens.InputBox import InputBox
             self.session.openWithCallback(
                 self.sleepTimerSet,
                 InputBox,
@@ -1532,8 +1763,9 @@ class WestyAudioPlayer(Screen):
     def savePlaylist(self):
         """Save playlist to file"""
         try:
-            from Screens.VirtualKeyBoard import VirtualKeyBoard
-            
+            if VirtualKeyBoard is None:
+                debug_print("savePlaylist: VirtualKeyBoard not available")
+                return
             default_name = "my_playlist.m3u"
             self.session.openWithCallback(
                 lambda name: self.doSavePlaylist(name if name else default_name),
@@ -1547,7 +1779,7 @@ class WestyAudioPlayer(Screen):
     def doSavePlaylist(self, filename):
         """Save playlist to file"""
         try:
-            if not filename.lower().endswith('.m3u'):
+            if not filename.lower().endswith(('.m3u', '.m3u8')):
                 filename += '.m3u'
             
             # Use /tmp directory for saving
@@ -1562,12 +1794,11 @@ class WestyAudioPlayer(Screen):
                     self.showError(_("Error saving playlist"))
             else:
                 # Manual save
+                header = "#EXTM3U\n# Created by %s v%s\n# Date: %s\n" % (
+                    PLUGIN_NAME, PLUGIN_VERSION, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                body = "".join(["%s\n" % track for track in self.playlist])
                 with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write("#EXTM3U\n")
-                    f.write("# Created by %s v%s\n" % (PLUGIN_NAME, PLUGIN_VERSION))
-                    f.write("# Date: %s\n" % datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-                    for track in self.playlist:
-                        f.write("%s\n" % track)
+                    f.write(header + body)
                 
                 self.showMessage(_("Playlist saved to: %s") % full_path)
                 debug_print("Playlist saved: %s" % full_path)
@@ -1579,7 +1810,10 @@ class WestyAudioPlayer(Screen):
     def loadPlaylist(self):
         """Load playlist from file"""
         try:
-            from Screens.FileBrowser import FileBrowser
+            if FileBrowser is None:
+                debug_print("loadPlaylist: FileBrowser not available")
+                self.showError(_("Error loading playlist"))
+                return
             
             def playlistSelected(selected):
                 if selected:
@@ -1591,24 +1825,34 @@ class WestyAudioPlayer(Screen):
                             # Manual parse
                             playlist = []
                             base_dir = os.path.dirname(selected)
+                            isabs = os.path.isabs
+                            exists = os.path.exists
+                            join = os.path.join
+                            # Stat each distinct path once, however often it repeats
+                            found = {}
                             
                             with open(selected, 'r', encoding='utf-8', errors='ignore') as f:
-                                for line in f:
-                                    line = line.strip()
-                                    if line and not line.startswith('#'):
-                                        if os.path.isabs(line):
-                                            if os.path.exists(line):
-                                                playlist.append(line)
-                                        else:
-                                            rel_path = os.path.join(base_dir, line)
-                                            if os.path.exists(rel_path):
-                                                playlist.append(rel_path)
-                                            else:
-                                                playlist.append(line)
+                                lines = f.readlines()
+                            
+                            for line in lines:
+                                line = line.strip()
+                                if not line or line[0] == '#':
+                                    continue
+                                relative = not isabs(line)
+                                path = join(base_dir, line) if relative else line
+                                ok = found.get(path)
+                                if ok is None:
+                                    ok = found[path] = exists(path)
+                                if ok:
+                                    playlist.append(path)
+                                elif relative:
+                                    # Unresolved relative entries are kept as written
+                                    playlist.append(line)
                         
                         if playlist:
                             self.playlist = playlist
                             self.current_index = 0
+                            self.play_order = []
                             self.loadAudioFile(self.playlist[0])
                             self.showMessage(_("Playlist loaded: %d tracks") % len(playlist))
                             debug_print("Playlist loaded: %d tracks" % len(playlist))
@@ -1622,7 +1866,7 @@ class WestyAudioPlayer(Screen):
                 FileBrowser,
                 "/tmp",
                 showDirectories=False,
-                matchingPattern=".*\\.m3u$"
+                matchingPattern=_M3U_PATTERN
             )
             
         except Exception as e:
@@ -1632,11 +1876,10 @@ class WestyAudioPlayer(Screen):
     def openSettings(self):
         """Open audio player settings"""
         try:
-            # Try to import audio player settings
-            try:
-                from .AudioPlayerSettings import WestyAudioPlayerSettings
-                self.session.open(WestyAudioPlayerSettings)
-            except ImportError:
+            settings = _optional_screen('AudioPlayerSettings', 'WestyAudioPlayerSettings')
+            if settings:
+                self.session.open(settings)
+            else:
                 self.showMessage(_("Audio player settings not available"))
         except Exception as e:
             debug_print("openSettings error: %s" % str(e))
@@ -1645,8 +1888,6 @@ class WestyAudioPlayer(Screen):
     def showAbout(self):
         """Show about information"""
         try:
-            from Screens.MessageBox import MessageBox
-            
             about_text = _("""%s Audio Player v%s
 
 Advanced audio player with professional features:
@@ -1668,7 +1909,8 @@ Advanced audio player with professional features:
     def showMessage(self, message, type="info"):
         """Show message to user"""
         try:
-            from Screens.MessageBox import MessageBox
+            if MessageBox is None:
+                return
             msg_type = MessageBox.TYPE_INFO if type == "info" else MessageBox.TYPE_ERROR
             self.session.open(MessageBox, message, msg_type, timeout=3)
         except Exception as e:
@@ -1677,7 +1919,8 @@ Advanced audio player with professional features:
     def showError(self, error):
         """Show error message"""
         try:
-            from Screens.MessageBox import MessageBox
+            if MessageBox is None:
+                return
             self.session.open(MessageBox, error, MessageBox.TYPE_ERROR, timeout=5)
             debug_print("Error shown: %s" % error)
         except Exception as e:
@@ -1695,24 +1938,29 @@ Advanced audio player with professional features:
     def cleanup(self):
         """Clean up resources"""
         try:
-            if hasattr(self.update_timer, 'stop'):
-                self.update_timer.stop()
-            if hasattr(self.visualization_timer, 'stop'):
-                self.visualization_timer.stop()
-            if hasattr(self.spectrum_timer, 'stop'):
-                self.spectrum_timer.stop()
+            if hasattr(self.tick_timer, 'stop'):
+                self.tick_timer.stop()
+            self.flushConfig()
             
             if ENIGMA_CORE_AVAILABLE and hasattr(self.session, 'nav'):
                 if self.session.nav.getCurrentlyPlayingServiceReference():
                     self.session.nav.stopService()
             
-            # Clean up temp album art file
-            if self.album_art and os.path.exists(self.album_art):
-                try:
-                    os.unlink(self.album_art)
-                    debug_print("Cleaned up album art: %s" % self.album_art)
-                except Exception as e:
-                    debug_print("Error cleaning up album art: %s" % str(e))
+            # Clean up temp album art files; tag reads still running see
+            # closed and delete their own art instead of caching it
+            with self.tag_lock:
+                self.closed = True
+                self.tag_generation += 1
+                self.pending_tags = None
+                art_paths = list(self.art_cache.values())
+                self.art_cache.clear()
+            for art_path in art_paths:
+                if art_path and os.path.exists(art_path):
+                    try:
+                        os.unlink(art_path)
+                        debug_print("Cleaned up album art: %s" % art_path)
+                    except Exception as e:
+                        debug_print("Error cleaning up album art: %s" % str(e))
             
             debug_print("Audio player cleaned up")
             
@@ -1733,7 +1981,6 @@ def playAudio(session, audio_file, playlist=None):
     except Exception as e:
         debug_print("playAudio error: %s" % str(e))
         try:
-            from Screens.MessageBox import MessageBox
             session.open(MessageBox, _("Error starting audio player: %s") % str(e), MessageBox.TYPE_ERROR)
         except:
             pass
@@ -4,7 +4,11 @@
 from __future__ import print_function, absolute_import, division, unicode_literals
 
 import os
+import re
 import sys
+from collections import ChainMap
+from functools import lru_cache
+from types import MappingProxyType
 
 # Import plugin utilities
 try:
@@ -14,7 +18,8 @@ try:
         ensure_str,
         ensure_unicode,
         PLUGIN_NAME,
-        PLUGIN_VERSION
+        PLUGIN_VERSION,
+        DEBUG
     )
     debug_print(f"AudioPlayerSettings: Imported plugin utilities v{PLUGIN_VERSION}")
 except ImportError:
@@ -30,16 +35,14 @@ except ImportError:
         if s is None:
             return ""
         if isinstance(s, bytes):
-            try:
-                return s.decode(encoding)
-            except:
-                return s.decode('latin-1', 'ignore')
+            return s.decode(encoding, 'replace')
         return str(s)
     
     ensure_unicode = ensure_str
     
     PLUGIN_NAME = "Westy FileMaster PRO"
     PLUGIN_VERSION = "2.1.0"
+    DEBUG = True
 
 # Import media utilities
 try:
@@ -66,6 +69,18 @@ except ImportError:
         def close(self):
             pass
 
+# Dialog screens used for editing and messages
+try:
+    from Screens.ChoiceBox import ChoiceBox
+    from Screens.InputBox import InputBox
+    from Screens.MessageBox import MessageBox
+    DIALOGS_AVAILABLE = True
+    debug_print("AudioPlayerSettings: Dialog screens available")
+except ImportError:
+    DIALOGS_AVAILABLE = False
+    debug_print("AudioPlayerSettings: Dialog screens not available")
+    ChoiceBox = InputBox = MessageBox = None
+
 try:
     from Components.ActionMap import ActionMap
     ACTIONMAP_AVAILABLE = True
@@ -112,26 +127,16 @@ except ImportError:
                 return Size()
         return Desktop()
 
-# Get screen size for skin
+# Get screen size for skin; queried once and reused by the skin code
 try:
-    FULLHD = getDesktop(0).size().width() >= 1920
+    _desktop_size = getDesktop(0).size()
+    DESKTOP_WIDTH, DESKTOP_HEIGHT = _desktop_size.width(), _desktop_size.height()
+    FULLHD = DESKTOP_WIDTH >= 1920
 except:
-    FULLHD = False
+    DESKTOP_WIDTH, DESKTOP_HEIGHT, FULLHD = 800, 600, False
 
-class WestyAudioPlayerSettings(Screen):
-    """Audio player settings - v2.1.0"""
-    
-    # Dynamic skin based on screen size
-    @staticmethod
-    def get_skin():
-        """Generate skin based on desktop size"""
-        try:
-            desktop = getDesktop(0)
-            screen_width, screen_height = desktop.size().width(), desktop.size().height()
-        except:
-            screen_width, screen_height = 800, 600
-        
-        return """
+# Whitespace between tags is collapsed once here so the skin parser never sees it
+_SKIN_TEMPLATE = re.sub(r">\s+<", "><", """
         <screen name="WestyAudioPlayerSettings" position="center,center" size="{width},{height}" title="{plugin_name} Audio Player Settings v{version}">
             <widget name="title" position="{title_x},{title_y}" size="{title_width},40" font="Regular;{title_font}" halign="center"/>
             
@@ -159,25 +164,97 @@ class WestyAudioPlayerSettings(Screen):
             <widget source="key_green" render="Label" position="{key2_x},{key_y}" size="{key_width},40" font="Regular;{key_font}" backgroundColor="green" halign="center"/>
             <widget source="key_blue" render="Label" position="{key3_x},{key_y}" size="{key_width},40" font="Regular;{key_font}" backgroundColor="blue" halign="center"/>
         </screen>
-        """.format(
-            width=screen_width,
-            height=screen_height,
-            title_x=50 if screen_width >= 800 else 20,
-            title_y=30 if screen_height >= 600 else 20,
-            title_width=screen_width-100 if screen_width >= 800 else screen_width-40,
-            title_font=28 if screen_width >= 800 else 22,
-            label_x=50 if screen_width >= 800 else 30,
-            value_x=400 if screen_width >= 800 else 300,
-            font_size=24 if screen_width >= 800 else 18,
-            key_y=screen_height-80 if screen_height >= 600 else screen_height-60,
-            key1_x=100 if screen_width >= 800 else 50,
-            key2_x=350 if screen_width >= 800 else 225,
-            key3_x=600 if screen_width >= 800 else 400,
-            key_width=200 if screen_width >= 800 else 150,
-            key_font=24 if screen_width >= 800 else 20,
-            plugin_name=PLUGIN_NAME,
-            version=PLUGIN_VERSION
-        )
+        """).strip()
+
+# Skin parameters for desktops at least / below 800 wide and 600 high
+_LAYOUT_WIDE = {
+    'title_x': 50, 'title_margin': 100, 'title_font': 28,
+    'label_x': 50, 'value_x': 400, 'font_size': 24,
+    'key1_x': 100, 'key2_x': 350, 'key3_x': 600, 'key_width': 200, 'key_font': 24,
+}
+_LAYOUT_NARROW = {
+    'title_x': 20, 'title_margin': 40, 'title_font': 22,
+    'label_x': 30, 'value_x': 300, 'font_size': 18,
+    'key1_x': 50, 'key2_x': 225, 'key3_x': 400, 'key_width': 150, 'key_font': 20,
+}
+_LAYOUT_TALL = {'title_y': 30, 'key_margin': 80}
+_LAYOUT_SHORT = {'title_y': 20, 'key_margin': 60}
+
+@lru_cache(maxsize=4)
+def _build_skin(screen_width, screen_height):
+    """Generate settings skin for the given desktop size"""
+    params = dict(_LAYOUT_WIDE if screen_width >= 800 else _LAYOUT_NARROW)
+    params.update(_LAYOUT_TALL if screen_height >= 600 else _LAYOUT_SHORT)
+    params['width'] = screen_width
+    params['height'] = screen_height
+    params['title_width'] = screen_width - params['title_margin']
+    params['key_y'] = screen_height - params['key_margin']
+    params['plugin_name'] = PLUGIN_NAME
+    params['version'] = PLUGIN_VERSION
+    return _SKIN_TEMPLATE.format_map(params)
+
+# Values used for any setting the stored config does not have; read-only
+# because every settings screen shares it
+_DEFAULT_CONFIG = MappingProxyType({
+    'auto_play': True,
+    'crossfade': False,
+    'replaygain': True,
+    'visualization': True,
+    'gapless': True,
+    'volume': 80
+})
+
+# The plugin picks its translation once at import, so strings used on
+# every refresh or key press are translated once here
+_TR_ON = _("On")
+_TR_OFF = _("Off")
+_TR_SELECT_SETTING = _("Select setting to edit")
+_SETTING_CHOICES = (
+    (_("Auto-play"), "auto_play"),
+    (_("Crossfade"), "crossfade"),
+    (_("Replay Gain"), "replaygain"),
+    (_("Visualization"), "visualization"),
+    (_("Gapless"), "gapless"),
+    (_("Default volume"), "volume"),
+)
+# Label widget, text for the labels that never change after setup
+_STATIC_LABELS = (
+    ("title", _("Audio Player Settings")),
+    ("auto_play_label", _("Auto-play next track:")),
+    ("crossfade_label", _("Crossfade between tracks:")),
+    ("replaygain_label", _("Replay Gain normalization:")),
+    ("visualization_label", _("Visualization effects:")),
+    ("gapless_label", _("Gapless playback:")),
+    ("volume_label", _("Default volume:")),
+)
+
+class WestyAudioPlayerSettings(Screen):
+    """Audio player settings - v2.1.0"""
+    
+    # Toggle widget, config key
+    TOGGLES = (
+        ("auto_play_toggle", "auto_play"),
+        ("crossfade_toggle", "crossfade"),
+        ("replaygain_toggle", "replaygain"),
+        ("visualization_toggle", "visualization"),
+        ("gapless_toggle", "gapless"),
+    )
+    
+    # Config key -> method that edits it
+    SETTING_HANDLERS = {
+        "auto_play": "toggleBoolean",
+        "crossfade": "toggleBoolean",
+        "replaygain": "toggleBoolean",
+        "visualization": "toggleBoolean",
+        "gapless": "toggleBoolean",
+        "volume": "editVolume",
+    }
+    
+    # Dynamic skin based on screen size
+    @staticmethod
+    def get_skin():
+        """Generate skin based on desktop size"""
+        return _build_skin(DESKTOP_WIDTH, DESKTOP_HEIGHT)
     
     skin = get_skin()
     
@@ -186,26 +263,22 @@ class WestyAudioPlayerSettings(Screen):
             Screen.__init__(self, session)
             self.session = session
             
-            # Load configuration
-            self.config = {}
+            # Load configuration; edits go to a copy of the stored section
+            # and reach the shared config only on save, reads fall back to
+            # the defaults for keys it does not have
+            stored = {}
             if MEDIA_UTILS_AVAILABLE:
-                self.config = media_config.get_config('audioplayer')
-            else:
-                # Default configuration
-                self.config = {
-                    'auto_play': True,
-                    'crossfade': False,
-                    'replaygain': True,
-                    'visualization': True,
-                    'gapless': True,
-                    'volume': 80
-                }
+                stored = dict(media_config.get_config('audioplayer'))
+            self.config = ChainMap(stored, _DEFAULT_CONFIG)
+            self.dirty = set()  # keys changed since the screen opened
+            self.shown = {}  # widget -> value last written by updateDisplay
             
             self.setupWidgets()
             self.setupActions()
             self.updateDisplay()
             
-            debug_print(f"AudioPlayerSettings v{PLUGIN_VERSION}: Initialized")
+            if DEBUG:
+                debug_print(f"AudioPlayerSettings v{PLUGIN_VERSION}: Initialized")
             
         except Exception as e:
             debug_print(f"AudioPlayerSettings init error: {e}")
@@ -215,25 +288,13 @@ class WestyAudioPlayerSettings(Screen):
     def setupWidgets(self):
         """Setup screen widgets"""
         try:
-            self["title"] = Label(_("Audio Player Settings"))
-            
-            self["auto_play_label"] = Label(_("Auto-play next track:"))
-            self["auto_play_toggle"] = Label(_("On") if self.config.get('auto_play', True) else _("Off"))
-            
-            self["crossfade_label"] = Label(_("Crossfade between tracks:"))
-            self["crossfade_toggle"] = Label(_("On") if self.config.get('crossfade', False) else _("Off"))
-            
-            self["replaygain_label"] = Label(_("Replay Gain normalization:"))
-            self["replaygain_toggle"] = Label(_("On") if self.config.get('replaygain', True) else _("Off"))
-            
-            self["visualization_label"] = Label(_("Visualization effects:"))
-            self["visualization_toggle"] = Label(_("On") if self.config.get('visualization', True) else _("Off"))
-            
-            self["gapless_label"] = Label(_("Gapless playback:"))
-            self["gapless_toggle"] = Label(_("On") if self.config.get('gapless', True) else _("Off"))
+            for widget, text in _STATIC_LABELS:
+                self[widget] = Label(text)
             
-            self["volume_label"] = Label(_("Default volume:"))
-            self["volume_value"] = Label(f"{self.config.get('volume', 80)}%")
+            # Values are filled in by updateDisplay
+            for widget, key in self.TOGGLES:
+                self[widget] = Label("")
+            self["volume_value"] = Label("")
             
             self["key_red"] = StaticText(_("Cancel"))
             self["key_green"] = StaticText(_("Save"))
@@ -261,34 +322,30 @@ class WestyAudioPlayerSettings(Screen):
     def updateDisplay(self):
         """Update display with current values"""
         try:
-            self["auto_play_toggle"].setText(_("On") if self.config.get('auto_play', True) else _("Off"))
-            self["crossfade_toggle"].setText(_("On") if self.config.get('crossfade', False) else _("Off"))
-            self["replaygain_toggle"].setText(_("On") if self.config.get('replaygain', True) else _("Off"))
-            self["visualization_toggle"].setText(_("On") if self.config.get('visualization', True) else _("Off"))
-            self["gapless_toggle"].setText(_("On") if self.config.get('gapless', True) else _("Off"))
-            self["volume_value"].setText(f"{self.config.get('volume', 80)}%")
+            config = self.config
+            shown = self.shown
+            for widget, key in self.TOGGLES:
+                text = _TR_ON if config[key] else _TR_OFF
+                if shown.get(widget) != text:
+                    self[widget].setText(text)
+                    shown[widget] = text
+            
+            # Only rebuild the volume text when the value changed
+            volume = config['volume']
+            if shown.get('volume') != volume:
+                self["volume_value"].setText(f"{volume}%")
+                shown['volume'] = volume
         except Exception as e:
             debug_print(f"updateDisplay error: {e}")
     
     def toggleSetting(self):
         """Toggle the selected setting"""
         try:
-            from Screens.ChoiceBox import ChoiceBox
-            
-            settings = [
-                (_("Auto-play"), "auto_play"),
-                (_("Crossfade"), "crossfade"),
-                (_("Replay Gain"), "replaygain"),
-                (_("Visualization"), "visualization"),
-                (_("Gapless"), "gapless"),
-                (_("Default volume"), "volume"),
-            ]
-            
             self.session.openWithCallback(
                 self.settingSelected,
                 ChoiceBox,
-                title=_("Select setting to edit"),
-                list=[(name, key) for name, key in settings]
+                title=_TR_SELECT_SETTING,
+                list=list(_SETTING_CHOICES)
             )
         except Exception as e:
             debug_print(f"toggleSetting error: {e}")
@@ -297,29 +354,34 @@ class WestyAudioPlayerSettings(Screen):
     def settingSelected(self, choice):
         """Handle setting selection"""
         try:
-            if choice:
-                setting_key = choice[1]
-                
-                if setting_key == "volume":
-                    # Edit volume as number
-                    from Screens.InputBox import InputBox
-                    current_value = self.config.get(setting_key, 80)
-                    self.session.openWithCallback(
-                        lambda value: self.volumeSelected(value),
-                        InputBox,
-                        title=_("Enter default volume (0-100)"),
-                        text=str(current_value)
-                    )
-                else:
-                    # Toggle boolean setting
-                    current = self.config.get(setting_key, True)
-                    self.config[setting_key] = not current
-                    self.updateDisplay()
-                    debug_print(f"Toggled {setting_key}: {self.config[setting_key]}")
-                    
+            if not choice:
+                return
+            
+            setting_key = choice[1]
+            handler = self.SETTING_HANDLERS.get(setting_key)
+            if handler:
+                getattr(self, handler)(setting_key)
+            
         except Exception as e:
             debug_print(f"settingSelected error: {e}")
     
+    def editVolume(self, setting_key):
+        """Ask for a new volume value"""
+        self.session.openWithCallback(
+            self.volumeSelected,
+            InputBox,
+            title=_("Enter default volume (0-100)"),
+            text=str(self.config[setting_key])
+        )
+    
+    def toggleBoolean(self, setting_key):
+        """Flip a boolean setting"""
+        self.config[setting_key] = not self.config[setting_key]
+        self.dirty.add(setting_key)
+        self.updateDisplay()
+        if DEBUG:
+            debug_print(f"Toggled {setting_key}: {self.config[setting_key]}")
+    
     def volumeSelected(self, value):
         """Handle volume input"""
         try:
@@ -328,8 +390,10 @@ class WestyAudioPlayerSettings(Screen):
                     volume = int(value)
                     volume = max(0, min(100, volume))
                     self.config['volume'] = volume
+                    self.dirty.add('volume')
                     self.updateDisplay()
-                    debug_print(f"Set volume to {volume}%")
+                    if DEBUG:
+                        debug_print(f"Set volume to {volume}%")
                 except ValueError:
                     self.showMessage(_("Invalid number"))
         except Exception as e:
@@ -338,15 +402,20 @@ class WestyAudioPlayerSettings(Screen):
     def save(self):
         """Save settings"""
         try:
-            # Save to media config
+            # Save changed settings to media config; the file is written
+            # even without changes here, since other screens may have
+            # changed the shared config in memory
             if MEDIA_UTILS_AVAILABLE:
-                for key, value in self.config.items():
-                    media_config.set_config('audioplayer', key, value)
+                config = self.config
+                for key in self.dirty:
+                    media_config.set_config('audioplayer', key, config[key])
+                self.dirty.clear()
                 
-                # Save to file
+                # Written off the UI thread; save_to_file_async logs its own errors
                 config_file = "/tmp/westy_media_config.json"
-                media_config.save_to_file(config_file)
-                debug_print(f"Settings saved to {config_file}")
+                media_config.save_to_file_async(config_file)
+                if DEBUG:
+                    debug_print(f"Saving settings to {config_file}")
             
             self.showMessage(_("Settings saved"))
             self.close()
@@ -367,16 +436,8 @@ class WestyAudioPlayerSettings(Screen):
         """Reset to default values"""
         try:
             # Reset to defaults
-            default_config = {
-                'auto_play': True,
-                'crossfade': False,
-                'replaygain': True,
-                'visualization': True,
-                'gapless': True,
-                'volume': 80
-            }
-            
-            self.config.update(default_config)
+            self.config.update(_DEFAULT_CONFIG)
+            self.dirty.update(_DEFAULT_CONFIG)
             self.updateDisplay()
             self.showMessage(_("Defaults restored"))
             debug_print("Settings reset to defaults")
@@ -386,24 +447,19 @@ class WestyAudioPlayerSettings(Screen):
     
     def up(self):
         """Handle up navigation"""
-        try:
-            # Simple navigation
-            pass
-        except Exception as e:
-            debug_print(f"up error: {e}")
+        # Simple navigation
+        pass
     
     def down(self):
         """Handle down navigation"""
-        try:
-            # Simple navigation
-            pass
-        except Exception as e:
-            debug_print(f"down error: {e}")
+        # Simple navigation
+        pass
     
     def showMessage(self, message):
         """Show message to user"""
         try:
-            from Screens.MessageBox import MessageBox
+            if MessageBox is None:
+                return
             self.session.open(MessageBox, message, MessageBox.TYPE_INFO, timeout=2)
         except Exception as e:
             debug_print(f"showMessage error: {e}")
@@ -411,16 +467,17 @@ class WestyAudioPlayerSettings(Screen):
 
 # Test function
 if __name__ == "__main__":
-    print(f"{PLUGIN_NAME} Audio Player Settings v{PLUGIN_VERSION}")
-    print("=" * 60)
-    
-    print("Settings Configuration:")
-    print("  • Auto-play next track")
-    print("  • Crossfade between tracks")
-    print("  • Replay Gain normalization")
-    print("  • Visualization effects")
-    print("  • Gapless playback")
-    print("  • Default volume level")
-    
-    print("\n" + "=" * 60)
-    print("AudioPlayerSettings module ready for v2.1.0 integration")
\ No newline at end of file
+    print("\n".join([
+        f"{PLUGIN_NAME} Audio Player Settings v{PLUGIN_VERSION}",
+        "=" * 60,
+        "Settings Configuration:",
+        "  • Auto-play next track",
+        "  • Crossfade between tracks",
+        "  • Replay Gain normalization",
+        "  • Visualization effects",
+        "  • Gapless playback",
+        "  • Default volume level",
+        "",
+        "=" * 60,
+        "AudioPlayerSettings module ready for v2.1.0 integration",
+    ]))
@@ -5,6 +5,9 @@ from __future__ import print_function, absolute_import, division, unicode_litera
 
 import os
 import sys
+from collections import ChainMap
+from functools import lru_cache, partial
+from types import MappingProxyType
 
 # Import plugin utilities
 try:
@@ -14,7 +17,8 @@ try:
         ensure_str,
         ensure_unicode,
         PLUGIN_NAME,
-        PLUGIN_VERSION
+        PLUGIN_VERSION,
+        DEBUG
     )
     debug_print(f"AudioSettings: Imported plugin utilities v{PLUGIN_VERSION}")
 except ImportError:
@@ -30,16 +34,14 @@ except ImportError:
         if s is None:
             return ""
         if isinstance(s, bytes):
-            try:
-                return s.decode(encoding)
-            except:
-                return s.decode('latin-1', 'ignore')
+            return s.decode(encoding, 'replace')
         return str(s)
     
     ensure_unicode = ensure_str
     
     PLUGIN_NAME = "Westy FileMaster PRO"
     PLUGIN_VERSION = "2.1.0"
+    DEBUG = True
 
 # Import media utilities
 try:
@@ -66,6 +68,18 @@ except ImportError:
         def close(self):
             pass
 
+# Dialog screens used for editing and messages
+try:
+    from Screens.ChoiceBox import ChoiceBox
+    from Screens.InputBox import InputBox
+    from Screens.MessageBox import MessageBox
+    DIALOGS_AVAILABLE = True
+    debug_print("AudioSettings: Dialog screens available")
+except ImportError:
+    DIALOGS_AVAILABLE = False
+    debug_print("AudioSettings: Dialog screens not available")
+    ChoiceBox = InputBox = MessageBox = None
+
 try:
     from Components.ActionMap import ActionMap
     ACTIONMAP_AVAILABLE = True
@@ -112,26 +126,15 @@ except ImportError:
                 return Size()
         return Desktop()
 
-# Get screen size for skin
+# Get screen size for skin; queried once and reused by the skin code
 try:
-    FULLHD = getDesktop(0).size().width() >= 1920
+    _desktop_size = getDesktop(0).size()
+    DESKTOP_WIDTH, DESKTOP_HEIGHT = _desktop_size.width(), _desktop_size.height()
+    FULLHD = DESKTOP_WIDTH >= 1920
 except:
-    FULLHD = False
+    DESKTOP_WIDTH, DESKTOP_HEIGHT, FULLHD = 900, 700, False
 
-class WestyAudioSettings(Screen):
-    """Audio settings screen - v2.1.0"""
-    
-    # Dynamic skin based on screen size
-    @staticmethod
-    def get_skin():
-        """Generate skin based on desktop size"""
-        try:
-            desktop = getDesktop(0)
-            screen_width, screen_height = desktop.size().width(), desktop.size().height()
-        except:
-            screen_width, screen_height = 900, 700
-        
-        return """
+_SKIN_TEMPLATE = """
         <screen name="WestyAudioSettings" position="center,center" size="{width},{height}" title="{plugin_name} Audio Settings v{version}">
             <widget name="title" position="{title_x},{title_y}" size="{title_width},40" font="Regular;{title_font}" halign="center"/>
             
@@ -160,53 +163,114 @@ class WestyAudioSettings(Screen):
             <widget source="key_green" render="Label" position="{key2_x},{key_y}" size="{key_width},40" font="Regular;{key_font}" backgroundColor="green" halign="center"/>
             <widget source="key_blue" render="Label" position="{key3_x},{key_y}" size="{key_width},40" font="Regular;{key_font}" backgroundColor="blue" halign="center"/>
         </screen>
-        """.format(
-            width=screen_width,
-            height=screen_height,
-            title_x=50 if screen_width >= 900 else 20,
-            title_y=30 if screen_height >= 700 else 20,
-            title_width=screen_width-100 if screen_width >= 900 else screen_width-40,
-            title_font=28 if screen_width >= 900 else 22,
-            label_x=50 if screen_width >= 900 else 30,
-            value_x=300 if screen_width >= 900 else 200,
-            value_width=500 if screen_width >= 900 else 450,
-            font_size=24 if screen_width >= 900 else 18,
-            key_y=screen_height-80 if screen_height >= 700 else screen_height-60,
-            key1_x=100 if screen_width >= 900 else 50,
-            key2_x=350 if screen_width >= 900 else 260,
-            key3_x=600 if screen_width >= 900 else 470,
-            key_width=200 if screen_width >= 900 else 180,
-            key_font=24 if screen_width >= 900 else 20,
-            plugin_name=PLUGIN_NAME,
-            version=PLUGIN_VERSION
-        )
+        """
+
+# Skin parameters for desktops at least / below 900 wide and 700 high
+_LAYOUT_WIDE = {
+    'title_x': 50, 'title_margin': 100, 'title_font': 28,
+    'label_x': 50, 'value_x': 300, 'value_width': 500, 'font_size': 24,
+    'key1_x': 100, 'key2_x': 350, 'key3_x': 600, 'key_width': 200, 'key_font': 24,
+}
+_LAYOUT_NARROW = {
+    'title_x': 20, 'title_margin': 40, 'title_font': 22,
+    'label_x': 30, 'value_x': 200, 'value_width': 450, 'font_size': 18,
+    'key1_x': 50, 'key2_x': 260, 'key3_x': 470, 'key_width': 180, 'key_font': 20,
+}
+_LAYOUT_TALL = {'title_y': 30, 'key_margin': 80}
+_LAYOUT_SHORT = {'title_y': 20, 'key_margin': 60}
+
+@lru_cache(maxsize=4)
+def _build_skin(screen_width, screen_height):
+    """Generate settings skin for the given desktop size"""
+    params = dict(_LAYOUT_WIDE if screen_width >= 900 else _LAYOUT_NARROW)
+    params.update(_LAYOUT_TALL if screen_height >= 700 else _LAYOUT_SHORT)
+    params['width'] = screen_width
+    params['height'] = screen_height
+    params['title_width'] = screen_width - params['title_margin']
+    params['key_y'] = screen_height - params['key_margin']
+    params['plugin_name'] = PLUGIN_NAME
+    params['version'] = PLUGIN_VERSION
+    return _SKIN_TEMPLATE.format_map(params)
+
+# Values used for any setting the stored config does not have; read-only
+# because every settings screen shares it
+_DEFAULT_CONFIG = MappingProxyType({
+    'audio_output': 'stereo',
+    'volume': 80,
+    'balance': 50,
+    'bass_boost': False,
+    'surround': False,
+})
+
+# The plugin picks its translation once at import, so strings used on
+# every refresh are translated once here
+_TR_ON = _("On")
+_TR_OFF = _("Off")
+_TR_SELECT_SETTING = _("Select setting to edit")
+
+def _on_off(value):
+    """Text for a boolean setting"""
+    return _TR_ON if value else _TR_OFF
+
+# Choice label, (config key, how the value is edited)
+_SETTING_CHOICES = (
+    (_("Audio Output"), ("audio_output", "choice")),
+    (_("Volume"), ("volume", "number")),
+    (_("Balance"), ("balance", "number")),
+    (_("Bass Boost"), ("bass_boost", "toggle")),
+    (_("Surround Sound"), ("surround", "toggle")),
+)
+# Config key -> translated name, for dialog titles
+_SETTING_NAMES = {key: name for name, (key, kind) in _SETTING_CHOICES}
+_TR_SELECT_OUTPUT = _("Select audio output")
+_OUTPUT_CHOICES = (
+    ("stereo", _("Stereo")),
+    ("mono", _("Mono")),
+    ("surround", _("Surround")),
+)
+
+class WestyAudioSettings(Screen):
+    """Audio settings screen - v2.1.0"""
+    
+    # Value widget, config key, text for the value
+    FIELDS = (
+        ("output_mode", "audio_output", str.title),
+        ("volume_slider", "volume", lambda value: f"{value}%"),
+        ("balance_slider", "balance", lambda value: f"L {value} R"),
+        ("bass_toggle", "bass_boost", _on_off),
+        ("surround_toggle", "surround", _on_off),
+    )
+    
+    # Dynamic skin based on screen size
+    @staticmethod
+    def get_skin():
+        """Generate skin based on desktop size"""
+        return _build_skin(DESKTOP_WIDTH, DESKTOP_HEIGHT)
     
-    skin = get_skin()
+    # Built on first open so importing the module does not build the skin
+    skin = None
     
     def __init__(self, session):
         try:
+            if WestyAudioSettings.skin is None:
+                WestyAudioSettings.skin = self.get_skin()
             Screen.__init__(self, session)
             self.session = session
             
-            # Load configuration
-            self.config = {}
+            # Load configuration; writes go to the stored section, reads
+            # fall back to the defaults for keys it does not have
+            stored = {}
             if MEDIA_UTILS_AVAILABLE:
-                self.config = media_config.get_config('audiosettings')
-            else:
-                # Default configuration
-                self.config = {
-                    'audio_output': 'stereo',
-                    'volume': 80,
-                    'balance': 50,
-                    'bass_boost': False,
-                    'surround': False,
-                }
+                stored = media_config.get_config('audiosettings')
+            self.config = ChainMap(stored, _DEFAULT_CONFIG)
+            self.shown = {}  # config key -> value last written by updateDisplay
             
             self.setupWidgets()
             self.setupActions()
             self.updateDisplay()
             
-            debug_print(f"AudioSettings v{PLUGIN_VERSION}: Initialized")
+            if DEBUG:
+                debug_print(f"AudioSettings v{PLUGIN_VERSION}: Initialized")
             
         except Exception as e:
             debug_print(f"AudioSettings init error: {e}")
@@ -218,22 +282,21 @@ class WestyAudioSettings(Screen):
         try:
             self["title"] = Label(_("Audio Settings"))
             
+            # Values are filled in by updateDisplay
             self["output_label"] = Label(_("Audio Output:"))
-            self["output_mode"] = Label(self.config.get('audio_output', 'stereo').title())
+            self["output_mode"] = Label("")
             
             self["volume_label"] = Label(_("Volume:"))
-            self["volume_slider"] = Label(f"{self.config.get('volume', 80)}%")
+            self["volume_slider"] = Label("")
             
             self["balance_label"] = Label(_("Balance:"))
-            balance = self.config.get('balance', 50)
-            balance_text = f"L {balance} R"
-            self["balance_slider"] = Label(balance_text)
+            self["balance_slider"] = Label("")
             
             self["bass_label"] = Label(_("Bass Boost:"))
-            self["bass_toggle"] = Label(_("On") if self.config.get('bass_boost', False) else _("Off"))
+            self["bass_toggle"] = Label("")
             
             self["surround_label"] = Label(_("Surround Sound:"))
-            self["surround_toggle"] = Label(_("On") if self.config.get('surround', False) else _("Off"))
+            self["surround_toggle"] = Label("")
             
             self["key_red"] = StaticText(_("Cancel"))
             self["key_green"] = StaticText(_("Save"))
@@ -263,14 +326,13 @@ class WestyAudioSettings(Screen):
     def updateDisplay(self):
         """Update display with current values"""
         try:
-            self["output_mode"].setText(self.config.get('audio_output', 'stereo').title())
-            self["volume_slider"].setText(f"{self.config.get('volume', 80)}%")
-            
-            balance = self.config.get('balance', 50)
-            self["balance_slider"].setText(f"L {balance} R")
-            
-            self["bass_toggle"].setText(_("On") if self.config.get('bass_boost', False) else _("Off"))
-            self["surround_toggle"].setText(_("On") if self.config.get('surround', False) else _("Off"))
+            config = self.config
+            shown = self.shown
+            for widget, key, text in self.FIELDS:
+                value = config[key]
+                if shown.get(key) != value:
+                    self[widget].setText(text(value))
+                    shown[key] = value
             
         except Exception as e:
             debug_print(f"updateDisplay error: {e}")
@@ -278,21 +340,11 @@ class WestyAudioSettings(Screen):
     def editSetting(self):
         """Edit current setting"""
         try:
-            from Screens.ChoiceBox import ChoiceBox
-            
-            settings = [
-                (_("Audio Output"), "audio_output", "choice"),
-                (_("Volume"), "volume", "number"),
-                (_("Balance"), "balance", "number"),
-                (_("Bass Boost"), "bass_boost", "toggle"),
-                (_("Surround Sound"), "surround", "toggle"),
-            ]
-            
             self.session.openWithCallback(
                 self.settingSelected,
                 ChoiceBox,
-                title=_("Select setting to edit"),
-                list=[(name, (key, type)) for name, key, type in settings]
+                title=_TR_SELECT_SETTING,
+                list=list(_SETTING_CHOICES)
             )
         except Exception as e:
             debug_print(f"editSetting error: {e}")
@@ -306,38 +358,31 @@ class WestyAudioSettings(Screen):
                 
                 if setting_type == "toggle":
                     # Toggle boolean setting
-                    current = self.config.get(setting_key, False)
-                    self.config[setting_key] = not current
+                    self.config[setting_key] = not self.config[setting_key]
                     self.updateDisplay()
-                    debug_print(f"Toggled {setting_key}: {self.config[setting_key]}")
+                    if DEBUG:
+                        debug_print(f"Toggled {setting_key}: {self.config[setting_key]}")
                 
                 elif setting_type == "choice":
                     # Show choices for selection setting
                     if setting_key == "audio_output":
-                        choices = [
-                            ("stereo", _("Stereo")),
-                            ("mono", _("Mono")),
-                            ("surround", _("Surround")),
-                        ]
-                        
                         self.session.openWithCallback(
-                            lambda value: self.choiceSelected(setting_key, value),
+                            partial(self.choiceSelected, setting_key),
                             ChoiceBox,
-                            title=_("Select audio output"),
-                            list=choices
+                            title=_TR_SELECT_OUTPUT,
+                            list=list(_OUTPUT_CHOICES)
                         )
                 
                 elif setting_type == "number":
                     # Edit numeric value
-                    from Screens.InputBox import InputBox
-                    current_value = self.config.get(setting_key, 80 if setting_key == "volume" else 50)
+                    current_value = self.config[setting_key]
                     min_val = 0
                     max_val = 100
                     
                     self.session.openWithCallback(
-                        lambda value: self.numberSelected(setting_key, value, min_val, max_val),
+                        partial(self.numberSelected, setting_key, min_val=min_val, max_val=max_val),
                         InputBox,
-                        title=_("Enter {} ({}-{})").format(setting_key.replace("_", " "), min_val, max_val),
+                        title=_("Enter %s (%d-%d)") % (_SETTING_NAMES[setting_key], min_val, max_val),
                         text=str(current_value)
                     )
                     
@@ -350,7 +395,8 @@ class WestyAudioSettings(Screen):
             if value:
                 self.config[setting_key] = value[1]
                 self.updateDisplay()
-                debug_print(f"Set {setting_key} to {value[1]}")
+                if DEBUG:
+                    debug_print(f"Set {setting_key} to {value[1]}")
         except Exception as e:
             debug_print(f"choiceSelected error: {e}")
     
@@ -363,9 +409,10 @@ class WestyAudioSettings(Screen):
                     if min_val <= num_value <= max_val:
                         self.config[setting_key] = num_value
                         self.updateDisplay()
-                        debug_print(f"Set {setting_key} to {num_value}")
+                        if DEBUG:
+                            debug_print(f"Set {setting_key} to {num_value}")
                     else:
-                        self.showMessage(_("Value must be between {} and {}").format(min_val, max_val))
+                        self.showMessage(_("Value must be between %d and %d") % (min_val, max_val))
                 except ValueError:
                     self.showMessage(_("Invalid number"))
         except Exception as e:
@@ -382,7 +429,8 @@ class WestyAudioSettings(Screen):
                 # Save to file
                 config_file = "/tmp/westy_media_config.json"
                 media_config.save_to_file(config_file)
-                debug_print(f"Settings saved to {config_file}")
+                if DEBUG:
+                    debug_print(f"Settings saved to {config_file}")
             
             self.showMessage(_("Settings saved"))
             self.close()
@@ -402,16 +450,7 @@ class WestyAudioSettings(Screen):
     def defaults(self):
         """Reset to default values"""
         try:
-            # Reset to defaults
-            default_config = {
-                'audio_output': 'stereo',
-                'volume': 80,
-                'balance': 50,
-                'bass_boost': False,
-                'surround': False,
-            }
-            
-            self.config.update(default_config)
+            self.config.update(_DEFAULT_CONFIG)
             self.updateDisplay()
             self.showMessage(_("Defaults restored"))
             debug_print("Settings reset to defaults")
@@ -454,7 +493,8 @@ class WestyAudioSettings(Screen):
     def showMessage(self, message):
         """Show message to user"""
         try:
-            from Screens.MessageBox import MessageBox
+            if MessageBox is None:
+                return
             self.session.open(MessageBox, message, MessageBox.TYPE_INFO, timeout=2)
         except Exception as e:
             debug_print(f"showMessage error: {e}")
@@ -5,9 +5,12 @@
 from __future__ import print_function, absolute_import, division, unicode_literals
 
 import os
+import re
 import sys
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 
 # Import plugin utilities
 try:
@@ -33,10 +36,7 @@ except ImportError:
         if s is None:
             return ""
         if isinstance(s, bytes):
-            try:
-                return s.decode(encoding)
-            except:
-                return s.decode('latin-1', 'ignore')
+            return s.decode(encoding, 'replace')
         return str(s)
     
     ensure_unicode = ensure_str
@@ -45,25 +45,83 @@ except ImportError:
     PLUGIN_VERSION = "2.1.0"
 
 
+# Leading track number such as "01 - " or "3." stripped from display names
+_TRACK_PREFIX_RE = re.compile(r'^\d{1,3}\s*[.-]\s*')
+
+# Non-blank, non-comment M3U line (leading whitespace skipped); accepts
+# \n, \r\n and bare \r line endings like bytes.splitlines()
+_M3U_ENTRY_RE = re.compile(rb'(?:\A|(?<=[\r\n]))[ \t\f\v]*([^#\s][^\r\n]*)')
+
+# Single-pass '_' -> ' ' mapping for display names
+_UNDERSCORE_TABLE = str.maketrans({'_': ' '})
+
+# Display names longer than _MAX_NAME_LEN are cut to _TRUNC_LEN plus suffix
+_MAX_NAME_LEN = 50
+_TRUNC_LEN = 47
+_TRUNC_SUFFIX = "..."
+
+# Entry prefixes that mark a playlist line as a network stream, not a file
+_STREAM_URL_PREFIXES = ('http://', 'https://', 'rtsp://', 'rtmp://', 'mms://', 'udp://', 'rtp://', 'ftp://')
+
+
+def _has_stem(filename, dot):
+    """True if the name before the dot at index dot is not only dots
+
+    Matches os.path.splitext, which gives dotfiles such as ".mp3" no
+    extension.
+    """
+    i = dot - 1
+    while i >= 0 and filename[i] == '.':
+        i -= 1
+    return i >= 0 and filename[i] != os.sep
+
+
+# Names like "01 - Intro.mp3" recur across album folders, so cache results
+@lru_cache(maxsize=4096)
+def _clean_display_name(filename):
+    """Build display name for a non-empty filename"""
+    # Remove extension
+    name = os.path.splitext(filename)[0]
+    
+    # Clean up common patterns
+    name = name.translate(_UNDERSCORE_TABLE)
+    if '-' in name:
+        name = name.replace('-', ' - ')
+    
+    # Remove track numbers at beginning
+    name = _TRACK_PREFIX_RE.sub('', name)
+    
+    # Trim and limit length
+    name = name.strip()
+    return name[:_TRUNC_LEN] + _TRUNC_SUFFIX if len(name) > _MAX_NAME_LEN else name
+
+
 # Common media utilities
 class MediaUtils:
     """Common utilities for media modules"""
     
+    # Kept as tuples for str.endswith; no extension is longer than 5
+    # characters, so the is_*_file checks only lower-case the tail
     SUPPORTED_AUDIO_EXTS = ('.mp3', '.flac', '.ogg', '.wav', '.aac', '.m4a', '.wma', '.opus')
+    _AUDIO_EXT_SET = frozenset(SUPPORTED_AUDIO_EXTS)
     SUPPORTED_VIDEO_EXTS = ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.m4v', '.mpg', '.mpeg')
     SUPPORTED_PLAYLIST_EXTS = ('.m3u', '.m3u8', '.pls', '.xspf')
     
     @staticmethod
     def is_audio_file(filename):
         """Check if file is audio"""
-        ext = os.path.splitext(filename)[1].lower()
-        return ext in MediaUtils.SUPPORTED_AUDIO_EXTS
+        # Reject names without a dot or with an over-long extension before
+        # lower-casing anything; this is the common case in mixed folders
+        dot = filename.rfind('.')
+        if dot < 0 or len(filename) - dot > 5:
+            return False
+        return filename[dot:].lower() in MediaUtils._AUDIO_EXT_SET and _has_stem(filename, dot)
     
     @staticmethod
     def is_video_file(filename):
         """Check if file is video"""
-        ext = os.path.splitext(filename)[1].lower()
-        return ext in MediaUtils.SUPPORTED_VIDEO_EXTS
+        return (filename[-5:].lower().endswith(MediaUtils.SUPPORTED_VIDEO_EXTS)
+                and _has_stem(filename, filename.rfind('.')))
     
     @staticmethod
     def is_media_file(filename):
@@ -73,8 +131,8 @@ class MediaUtils:
     @staticmethod
     def is_playlist_file(filename):
         """Check if file is a playlist"""
-        ext = os.path.splitext(filename)[1].lower()
-        return ext in MediaUtils.SUPPORTED_PLAYLIST_EXTS
+        return (filename[-5:].lower().endswith(MediaUtils.SUPPORTED_PLAYLIST_EXTS)
+                and _has_stem(filename, filename.rfind('.')))
     
     @staticmethod
     def parse_m3u_playlist(filepath):
@@ -84,27 +142,45 @@ class MediaUtils:
                 debug_print(f"Playlist file not found: {filepath}")
                 return []
             
-            playlist = []
             base_dir = os.path.dirname(filepath)
             
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        # Handle paths
-                        if os.path.isabs(line):
-                            if os.path.exists(line):
-                                playlist.append(line)
-                            else:
-                                debug_print(f"Absolute path not found: {line}")
-                        else:
-                            # Try relative to playlist directory
-                            rel_path = os.path.join(base_dir, line)
-                            if os.path.exists(rel_path):
-                                playlist.append(rel_path)
-                            else:
-                                # Keep original for reference
-                                playlist.append(line)
+            # Read the whole file at once and split in C rather than
+            # iterating line-by-line through the text-mode reader
+            with open(filepath, 'rb') as f:
+                data = f.read()
+            
+            # Pick out entry lines with one regex scan over the raw bytes;
+            # blanks and comments are skipped without ever being decoded.
+            # The regex only knows ASCII whitespace, so the decoded text is
+            # stripped and checked again for Unicode spaces such as NBSP
+            decoded = (raw.decode('utf-8', 'ignore').strip()
+                       for raw in _M3U_ENTRY_RE.findall(data))
+            entries = [line for line in decoded if line and not line.startswith('#')]
+            
+            # Stream playlists (IPTV/radio) hold only URLs, which are never
+            # resolved on disk and are kept as-is, so skip the per-entry
+            # path handling and its stat calls altogether
+            if entries and all(line.startswith(_STREAM_URL_PREFIXES) for line in entries):
+                debug_print(f"Loaded stream playlist with {len(entries)} entries")
+                return entries
+            
+            isabs = os.path.isabs
+            join = os.path.join
+            exists = os.path.exists
+            playlist = []
+            append = playlist.append
+            for line in entries:
+                # Handle paths
+                if isabs(line):
+                    if exists(line):
+                        append(line)
+                    else:
+                        debug_print(f"Absolute path not found: {line}")
+                else:
+                    # Try relative to playlist directory
+                    rel_path = join(base_dir, line)
+                    # Keep original for reference if not found
+                    append(rel_path if exists(rel_path) else line)
             
             debug_print(f"Loaded playlist with {len(playlist)} tracks")
             return playlist
@@ -117,12 +193,19 @@ class MediaUtils:
     def save_m3u_playlist(filepath, playlist):
         """Save playlist to M3U file"""
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("#EXTM3U\n")
-                f.write(f"# Created by {PLUGIN_NAME} v{PLUGIN_VERSION}\n")
-                f.write(f"# Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                for track in playlist:
-                    f.write(f"{track}\n")
+            header = (f"#EXTM3U\n"
+                      f"# Created by {PLUGIN_NAME} v{PLUGIN_VERSION}\n"
+                      f"# Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            # Encode straight into one growing buffer so no intermediate
+            # list or joined string of the whole playlist is built
+            buf = bytearray(header.encode('utf-8'))
+            for track in playlist:
+                buf += ensure_str(track).encode('utf-8')
+                buf += b'\n'
+            
+            # Single write through a large buffer instead of one per track
+            with open(filepath, 'wb', buffering=1 << 20) as f:
+                f.write(buf)
             
             debug_print(f"Playlist saved: {filepath} ({len(playlist)} tracks)")
             return True
@@ -182,22 +265,7 @@ class MediaUtils:
         if not filename:
             return _("Unknown Track")
         
-        # Remove extension
-        name = os.path.splitext(filename)[0]
-        
-        # Clean up common patterns
-        name = name.replace('_', ' ').replace('-', ' - ')
-        
-        # Remove track numbers at beginning
-        import re
-        name = re.sub(r'^\d{1,3}\s*[.-]\s*', '', name)
-        
-        # Trim and limit length
-        name = name.strip()
-        if len(name) > 50:
-            name = name[:47] + "..."
-        
-        return name
+        return _clean_display_name(filename)
     
     @staticmethod
     def get_media_info(filepath):
@@ -239,6 +307,12 @@ class MediaConfig:
     
     def __init__(self):
         self.config = {}
+        # Saves can write from background threads; the lock keeps writes
+        # from overlapping and the numbers stop an older snapshot from
+        # replacing a newer one
+        self._save_lock = threading.Lock()
+        self._snapshot_number = 0
+        self._saved_number = 0
         self._load_defaults()
     
     def _load_defaults(self):
@@ -294,14 +368,47 @@ class MediaConfig:
     def save_to_file(self, filepath):
         """Save configuration to file"""
         try:
-            import json
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
-            debug_print(f"Media config saved to {filepath}")
-            return True
+            text, number = self._snapshot()
         except Exception as e:
             debug_print(f"Error saving media config: {e}")
             return False
+        return self._write_snapshot(filepath, text, number)
+    
+    def save_to_file_async(self, filepath):
+        """Save configuration to file from a background thread"""
+        # The snapshot is taken here, on the UI thread that changes the
+        # config, so the thread never reads the live dicts
+        try:
+            text, number = self._snapshot()
+        except Exception as e:
+            debug_print(f"Error saving media config: {e}")
+            return
+        save_thread = threading.Thread(target=self._write_snapshot, args=(filepath, text, number))
+        save_thread.daemon = True
+        save_thread.start()
+    
+    def _snapshot(self):
+        """Serialise the configuration and number the snapshot (UI thread)"""
+        import json
+        self._snapshot_number += 1
+        return json.dumps(self.config, indent=2), self._snapshot_number
+    
+    def _write_snapshot(self, filepath, text, number):
+        """Write a snapshot unless a newer one is already on disk"""
+        with self._save_lock:
+            if number < self._saved_number:
+                return True
+            try:
+                tmp_path = filepath + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, filepath)
+                self._saved_number = number
+                debug_print(f"Media config saved to {filepath}")
+                return True
+            except Exception as e:
+                debug_print(f"Error saving media config: {e}")
+                return False
     
     def load_from_file(self, filepath):
         """Load configuration from file"""
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import AudioPlayer
+
+
+def make_player():
+    """Player with only the state the tag reader uses"""
+    player = AudioPlayer.WestyAudioPlayer.__new__(AudioPlayer.WestyAudioPlayer)
+    player.metadata = {}
+    player.current_file = None
+    player.pending_tags = None
+    player.art_cache = {}
+    player.tag_lock = threading.Lock()
+    player.tag_generation = 0
+    player.closed = False
+    return player
+
+
+class BackgroundTagTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_file = os.path.join(self.tmpdir.name, "old.flac")
+        self.new_file = os.path.join(self.tmpdir.name, "new.flac")
+        for path in (self.old_file, self.new_file):
+            with open(path, "wb") as f:
+                f.write(b"\0" * 16)
+        self.read_tags = AudioPlayer._read_audio_tags
+        self.mutagen = AudioPlayer.MUTAGEN_AVAILABLE
+
+    def tearDown(self):
+        AudioPlayer._read_audio_tags = self.read_tags
+        AudioPlayer.MUTAGEN_AVAILABLE = self.mutagen
+        self.tmpdir.cleanup()
+
+    def test_older_load_finishing_last_keeps_newer_tags(self):
+        player = make_player()
+        release_old = threading.Event()
+        old_reading = threading.Event()
+
+        def read_tags(filepath, mtime, size):
+            if filepath == self.old_file:
+                old_reading.set()
+                release_old.wait(5)
+            return {'title': os.path.basename(filepath)}
+        AudioPlayer._read_audio_tags = read_tags
+        AudioPlayer.MUTAGEN_AVAILABLE = False
+
+        # Old track: its tag read is still running when the next track loads
+        player.extractMetadata(self.old_file)
+        st = os.stat(self.old_file)
+        old_thread = threading.Thread(target=player._readTags,
+                                      args=(self.old_file, st.st_mtime, st.st_size,
+                                            player.tag_generation))
+        old_thread.start()
+        self.assertTrue(old_reading.wait(5))
+
+        # New track loads and its read finishes first
+        player.extractMetadata(self.new_file)
+        st = os.stat(self.new_file)
+        player._readTags(self.new_file, st.st_mtime, st.st_size, player.tag_generation)
+
+        release_old.set()
+        old_thread.join(5)
+
+        self.assertEqual(player.pending_tags[0], self.new_file)
+        self.assertEqual(player.pending_tags[1], {'title': "new.flac"})
+
+    def test_art_written_after_close_is_deleted(self):
+        player = make_player()
+        art_dir = os.path.join(self.tmpdir.name, "art")
+        os.mkdir(art_dir)
+        mp3 = os.path.join(self.tmpdir.name, "song.mp3")
+
+        class APIC(object):
+            data = b"jpeg"
+
+        class ID3(object):
+            def __init__(self, filepath, **kwargs):
+                pass
+
+            def getall(self, frame):
+                # The screen closes while the art is being extracted
+                player.closed = True
+                return [APIC()]
+
+        lazy = AudioPlayer._lazy
+        tempdir = tempfile.tempdir
+        AudioPlayer._lazy = lambda name: type("Module", (), {"ID3": ID3})
+        tempfile.tempdir = art_dir
+        try:
+            art_path = player.extractAlbumArt(mp3, 0, 0)
+        finally:
+            AudioPlayer._lazy = lazy
+            tempfile.tempdir = tempdir
+
+        self.assertEqual(art_path, "")
+        self.assertEqual(player.art_cache, {})
+        self.assertEqual(os.listdir(art_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from media_utils import MediaConfig, MediaUtils
+
+
+NAMES = (
+    "song.mp3", "SONG.MP3", "clip.mp4", "movie.MPEG", "list.m3u", "list.M3U8",
+    ".mp3", ".mp4", ".m3u", "..mp4", "a..mp4", "dir/.mp4", "dir/x.mp4",
+    "dir.mp4/file", "mp4", "", ".", "x.", "archive.tar.gz", "track.flac",
+)
+
+
+class FileTypeTest(unittest.TestCase):
+
+    def check(self, method, exts):
+        for name in NAMES:
+            expected = os.path.splitext(name)[1].lower() in exts
+            self.assertEqual(method(name), expected, name)
+
+    def test_audio_matches_splitext(self):
+        self.check(MediaUtils.is_audio_file, MediaUtils.SUPPORTED_AUDIO_EXTS)
+
+    def test_video_matches_splitext(self):
+        self.check(MediaUtils.is_video_file, MediaUtils.SUPPORTED_VIDEO_EXTS)
+
+    def test_playlist_matches_splitext(self):
+        self.check(MediaUtils.is_playlist_file, MediaUtils.SUPPORTED_PLAYLIST_EXTS)
+
+
+class M3UParseTest(unittest.TestCase):
+
+    def test_unicode_whitespace_is_stripped(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            track = os.path.join(tmpdir, "a.mp3")
+            open(track, "w").close()
+            playlist = os.path.join(tmpdir, "list.m3u")
+            with open(playlist, "w", encoding="utf-8") as f:
+                f.write("#EXTM3U\n\xa0a.mp3\n\xa0#comment\n\x85\n")
+            self.assertEqual(MediaUtils.parse_m3u_playlist(playlist), [track])
+
+
+class MediaConfigSaveTest(unittest.TestCase):
+
+    def test_older_snapshot_does_not_replace_newer_file(self):
+        config = MediaConfig()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "config.json")
+            config.set_config('audioplayer', 'volume', 10)
+            old = config._snapshot()
+            config.set_config('audioplayer', 'volume', 20)
+            self.assertTrue(config.save_to_file(path))
+
+            # A background write of the older snapshot finishing late
+            self.assertTrue(config._write_snapshot(path, *old))
+
+            with open(path, encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['audioplayer']['volume'], 20)
+            self.assertEqual(os.listdir(tmpdir), ["config.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()